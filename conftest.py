@@ -0,0 +1,55 @@
+"""
+Shared pytest fixtures for the top-level test scripts.
+"""
+
+import logging
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make `src` importable for every test module, added once per session
+PROJECT_ROOT = Path(__file__).parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# One root handler for the whole session; the scripts configure their own
+# logging under __main__ instead of at import time
+if not logging.root.handlers:
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Plain helpers live in testutils so the scripts can use them without pytest
+from testutils import FIXTURE_PDF, FIXTURE_PDF_EXISTS, build_pipeline
+
+
+@pytest.fixture(scope="session")
+def pipeline():
+    """Session-wide config/parser/audit components shared by every test."""
+    return build_pipeline()
+
+
+@pytest.fixture(scope="session")
+def sandbox_parser():
+    """One SandboxedPDFParser for the whole session."""
+    from src.sandboxing import SandboxedPDFParser
+    return SandboxedPDFParser()
+
+
+@pytest.fixture(scope="session")
+def queue_manager(sandbox_parser):
+    """A QueueManager over the session's sandbox parser."""
+    from src.queue_manager import QueueManager
+    return QueueManager(sandbox_parser)
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    """A private copy of test_sample.pdf in the test's tmp_path."""
+    if not FIXTURE_PDF_EXISTS:
+        pytest.skip(f"Sample PDF not found: {FIXTURE_PDF}")
+    path = tmp_path / FIXTURE_PDF.name
+    # copyfile uses the platform fast-copy path (sendfile on Linux) and
+    # never pulls the whole PDF into Python memory
+    shutil.copyfile(FIXTURE_PDF, path)
+    return path
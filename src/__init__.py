@@ -1 +1,24 @@
-# src package marker
\ No newline at end of file
+"""
+PDF Sanitizer application package.
+
+Submodules are imported on first attribute access (e.g. ``src.core_engine``),
+so importing the package does not pull in pikepdf or PyQt6.
+"""
+
+import importlib
+
+__all__ = [
+    'audit_logger', 'config_manager', 'core_engine', 'history_viewer',
+    'localization', 'main_gui', 'queue_manager', 'report_viewer',
+    'sandboxing', 'usb_monitor', 'usb_utils', 'worker_pdf_parser',
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
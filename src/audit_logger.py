@@ -1,18 +1,83 @@
 """
 Module: audit_logger
-Description: Provides a dual-format audit logging system for security and
-             compliance. It generates both human-readable text logs and
-             structured JSON logs for every sanitization event.
+Description: Provides the audit logging system for security and compliance.
+             It appends a structured JSON Lines record for every sanitization
+             event; the human-readable text report is rendered on demand.
 """
 
-import json
+import collections
 import logging
+import os
+import re
 from datetime import datetime
 from pathlib import Path
 import socket
 import hashlib
+import json
+import atexit
+import queue
+import threading
+import time
+import orjson
+from typing import Optional
 from src.localization import get_localization, ENGLISH
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Audit stream file names inside the log directory
+JSON_LOG_NAME = "audit.jsonl"
+
+# Size past which audit.jsonl is rotated into a timestamped segment
+ROTATE_BYTES = 16 * 1024 * 1024
+
+# Rotated segments: audit-YYYYMMDD-HHMMSS[-N].jsonl, or .jsonl.zst once compressed
+SEGMENT_RE = re.compile(r'^audit-(\d{8}-\d{6})(?:-(\d+))?\.jsonl(\.zst)?$')
+
+# Per-event JSON files written by earlier versions, STZ-YYYYMMDD-HHMMSSmmm.json.
+# They are still read by iter_events() so older history stays visible.
+LEGACY_EVENT_RE = re.compile(r'^STZ-\d{8}-\d{9}\.json$')
+
+# Buffer size for the long-lived audit file handles
+LOG_BUFFER_SIZE = 64 * 1024
+
+# Number of recently written events kept in memory for recent_logs()
+RECENT_EVENTS_MAX = 1024
+
+# How long the writer waits before retrying a batch whose write failed
+WRITE_RETRY_SECONDS = 1.0
+
+# Queued by close() to stop the writer thread
+_STOP = object()
+
+
+def latest_log_file(log_dir: Path, ext: str) -> Optional[Path]:
+    """
+    Returns the most recently modified file in log_dir ending with ext, or
+    None if there is none. Uses os.scandir so every entry is stat'ed during
+    the single directory walk.
+    """
+    entries = (e for e in os.scandir(log_dir) if e.is_file() and e.name.endswith(ext))
+    latest = max(entries, key=lambda e: e.stat().st_mtime, default=None)
+    return Path(latest.path) if latest else None
+
+
+def _compress_segment(segment: Path):
+    """Compresses a rotated segment to <segment>.zst and removes the original."""
+    target = segment.with_name(segment.name + ".zst")
+    partial = target.with_name(target.name + ".tmp")
+    try:
+        with open(segment, "rb") as src, open(partial, "wb") as dst:
+            zstandard.ZstdCompressor().copy_stream(src, dst)
+        os.replace(partial, target)
+        segment.unlink()
+        logging.info("[AUDIT_WRITER] Compressed audit log segment %s", target.name)
+    except Exception as e:
+        logging.error("[AUDIT_WRITER] Failed to compress %s: %s", segment.name, e)
+
+
 # Configure a dedicated logger for audit trails to avoid mixing with app logs
 audit_log = logging.getLogger("audit")
 audit_log.setLevel(logging.INFO)
@@ -20,33 +85,308 @@ audit_log.setLevel(logging.INFO)
 
 class AuditLogger:
     """
-    Handles the creation of detailed, dual-format audit logs for each
-    PDF sanitization operation.
+    Handles the creation of detailed audit logs for each PDF sanitization
+    operation.
+
+    Events are enriched on the caller's thread and handed to a single
+    background writer, which drains them in batches into one long-lived,
+    buffered file: audit.jsonl (one JSON record per line). Once it grows
+    past rotate_bytes it is renamed to a timestamped segment, which is
+    zstd-compressed in the background when zstandard is installed. Use
+    iter_events() to read every segment and render_txt() to get the
+    human-readable report for a record. Call flush() before reading to
+    make sure all queued events are on disk, and close() on shutdown.
     """
 
-    def __init__(self, log_directory: str, language: str = ENGLISH):
+    def __init__(self, log_directory: str, language: str = ENGLISH,
+                 batch_size: int = 64, flush_interval_ms: int = 200,
+                 rotate_bytes: int = ROTATE_BYTES):
         """
         Initializes the logger with a directory to store the logs.
         
         Args:
             log_directory (str): The path to the directory where logs will be saved.
             language (str): Language code for audit log messages (default: English)
+            batch_size (int): Maximum number of events written per batch.
+            flush_interval_ms (int): How long the writer waits for more events
+                before writing a partial batch.
+            rotate_bytes (int): Size at which audit.jsonl is rotated.
         """
         self.log_dir = Path(log_directory)
         try:
             self.log_dir.mkdir(parents=True, exist_ok=True)
-            logging.info(f"[AUDIT_LOGGER_INIT] Log directory created/verified: {self.log_dir}")
+            logging.info("[AUDIT_LOGGER_INIT] Log directory created/verified: %s", self.log_dir)
             # Verify directory is writable
             test_file = self.log_dir / ".audit_writetest"
             test_file.touch()
             test_file.unlink()
-            logging.info(f"[AUDIT_LOGGER_INIT] Log directory is writable")
+            logging.info("[AUDIT_LOGGER_INIT] Log directory is writable")
         except Exception as e:
-            logging.error(f"[AUDIT_LOGGER_INIT] Failed to initialize log directory {log_directory}: {e}")
+            logging.error("[AUDIT_LOGGER_INIT] Failed to initialize log directory %s: %s", log_directory, e)
             raise
         self.localization = get_localization(language)
         # TODO: Add file handlers to the 'audit_log' logger if needed for separation
 
+        self.json_log_path = self.log_dir / JSON_LOG_NAME
+        self._json_fh = self._open_json_log()
+        # In-memory index of recently written events, so readers do not need
+        # to rescan the log files to find the latest ones
+        self._recent_events = collections.deque(maxlen=RECENT_EVENTS_MAX)
+        # Total events written by this logger, see events_since()
+        self._written_count = 0
+        self._recent_lock = threading.Lock()
+        self.rotate_bytes = rotate_bytes
+        self._compressors = []
+
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self._queue = queue.Queue()
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="audit-log-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
+
+    def flush(self):
+        """
+        Blocks until every queued event has been handed to the writer and
+        written, or kept for retry if the write failed.
+        """
+        self._queue.join()
+
+    def recent_logs(self, n: int = None) -> list:
+        """
+        Returns up to n of the most recently written events, oldest first.
+        Events still queued are not included; call flush() first if needed.
+        """
+        with self._recent_lock:
+            events = list(self._recent_events)
+        return events if n is None else events[-n:]
+
+    def written_mark(self) -> int:
+        """Returns a mark for events_since(): the number of events written so far."""
+        with self._recent_lock:
+            return self._written_count
+
+    def events_since(self, mark: int) -> tuple:
+        """
+        Returns (events, mark): the events written after an earlier mark,
+        oldest first, and the mark to pass next time. events is None if some
+        of them have already dropped out of the recent index, in which case
+        the caller has to read the log files with iter_events().
+        """
+        with self._recent_lock:
+            count = self._written_count - mark
+            if count > len(self._recent_events):
+                return None, self._written_count
+            events = list(self._recent_events)[len(self._recent_events) - count:]
+            return events, self._written_count
+
+    def close(self):
+        """
+        Writes pending events, stops the writer thread and closes the audit
+        file. Safe to call more than once.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._queue.put(_STOP)
+        self._writer.join()
+        self._json_fh.close()
+        for compressor in self._compressors:
+            compressor.join()
+
+    def _writer_loop(self):
+        """
+        Background writer: drains the queue in batches of up to batch_size
+        queued items. Each item is a list of events from one log_events() call.
+        Events from a failed write are kept and retried ahead of newer ones,
+        every WRITE_RETRY_SECONDS while the queue is idle. Exits on _STOP.
+        """
+        pending = []
+        stopping = False
+        while not stopping:
+            try:
+                items = [self._queue.get(timeout=WRITE_RETRY_SECONDS if pending else None)]
+            except queue.Empty:
+                items = []
+            deadline = time.monotonic() + self.flush_interval
+            while items and items[-1] is not _STOP and len(items) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            stopping = bool(items) and items[-1] is _STOP
+            batch = pending + [event for item in items if item is not _STOP for event in item]
+            try:
+                if batch:
+                    self._write_batch(batch)
+                pending = []
+            except Exception as e:
+                logging.error("[AUDIT_WRITER] Failed to write batch of %s events, will retry: %s", len(batch), e)
+                pending = batch
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+        if pending:
+            logging.error("[AUDIT_WRITER] Audit log closed with %s unwritten events", len(pending))
+
+    def _write_batch(self, batch: list):
+        """
+        Appends a batch of enriched events to the audit file in one write.
+        An event that cannot be serialized is logged as an error and left
+        out of both the file and the recent index.
+        """
+        lines = []
+        written = []
+        for event in batch:
+            try:
+                lines.append(self._serialize_event(event))
+            except (TypeError, ValueError) as e:
+                logging.error("[AUDIT_WRITER] Audit record %s could not be serialized and was not written: %s",
+                              event.get('event_id'), e)
+                continue
+            written.append(event)
+        self._json_fh.write(b"".join(lines))
+        self._json_fh.flush()
+        with self._recent_lock:
+            self._recent_events.extend(written)
+            self._written_count += len(written)
+        # The batch is on disk; a failed rotation must not cause it to be retried
+        if self._json_fh.tell() > self.rotate_bytes:
+            try:
+                self._rotate()
+            except Exception as e:
+                logging.error("[AUDIT_WRITER] Failed to rotate audit log: %s", e)
+
+    def _rotate(self):
+        """
+        Renames the active log to a timestamped segment and reopens a fresh
+        audit.jsonl. The segment is compressed on a separate thread so the
+        writer is not held up. If the rename fails (on Windows, while another
+        handle has audit.jsonl open) the active file is reopened unchanged,
+        and rotation is attempted again after the next batch.
+        """
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        segment = self.log_dir / f"audit-{stamp}.jsonl"
+        n = 1
+        while segment.exists() or segment.with_name(segment.name + ".zst").exists():
+            segment = self.log_dir / f"audit-{stamp}-{n}.jsonl"
+            n += 1
+        # Windows cannot rename a file we still hold open, so close first
+        self._json_fh.close()
+        try:
+            os.replace(self.json_log_path, segment)
+        finally:
+            self._json_fh = self._open_json_log()
+        logging.info("[AUDIT_WRITER] Rotated audit log to %s", segment.name)
+
+        if zstandard is not None:
+            self._compressors = [t for t in self._compressors if t.is_alive()]
+            compressor = threading.Thread(
+                target=_compress_segment, args=(segment,), name="audit-log-compress", daemon=True
+            )
+            compressor.start()
+            self._compressors.append(compressor)
+        else:
+            logging.warning("zstandard not available - leaving %s uncompressed", segment.name)
+
+    def _open_json_log(self):
+        """
+        Opens audit.jsonl for appending. If an earlier writer was killed in
+        the middle of a record, the torn line is terminated first so the
+        next record starts on a line of its own.
+        """
+        fh = open(self.json_log_path, "ab", buffering=LOG_BUFFER_SIZE)
+        if fh.tell():
+            with open(self.json_log_path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                torn = f.read(1) != b"\n"
+            if torn:
+                fh.write(b"\n")
+                fh.flush()
+        return fh
+
+    def log_segments(self) -> list:
+        """
+        Returns the audit log files oldest first: rotated segments followed
+        by the active audit.jsonl. A segment still being compressed is
+        returned in its uncompressed form.
+        """
+        segments = {}
+        for entry in os.scandir(self.log_dir):
+            m = SEGMENT_RE.match(entry.name)
+            if not m:
+                continue
+            key = (m.group(1), int(m.group(2) or 0))
+            # Prefer the plain file until compression has removed it
+            if key not in segments or not m.group(3):
+                segments[key] = Path(entry.path)
+        paths = [segments[key] for key in sorted(segments)]
+        if self.json_log_path.exists():
+            paths.append(self.json_log_path)
+        return paths
+
+    def legacy_event_files(self) -> list:
+        """
+        Returns the per-event STZ-*.json records left by earlier versions,
+        oldest first (their names encode the event timestamp).
+        """
+        return sorted(
+            Path(entry.path) for entry in os.scandir(self.log_dir)
+            if entry.is_file() and LEGACY_EVENT_RE.match(entry.name)
+        )
+
+    def iter_events(self):
+        """
+        Yields every logged event, oldest first: legacy per-event STZ-*.json
+        records, then every segment of the JSONL stream. Lines that cannot
+        be decoded, such as a record torn by a crash mid-write, are skipped.
+        """
+        for path in self.legacy_event_files():
+            try:
+                yield orjson.loads(path.read_bytes())
+            except (OSError, orjson.JSONDecodeError) as e:
+                logging.warning("Skipping unreadable legacy audit record %s: %s", path.name, e)
+        for path in self.log_segments():
+            f = self._open_segment(path)
+            if f is None:
+                continue
+            with f:
+                for lineno, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        event = orjson.loads(line)
+                    except orjson.JSONDecodeError as e:
+                        logging.warning("Skipping unreadable audit record %s:%s: %s", path.name, lineno, e)
+                        continue
+                    yield event
+
+    def _open_segment(self, path: Path):
+        """
+        Opens a log segment for reading, or returns None if it cannot be read.
+        A plain segment listed by log_segments() may have been compressed and
+        removed since, in which case its .zst sibling is opened instead.
+        """
+        if path.suffix != ".zst":
+            try:
+                return open(path, "rb")
+            except FileNotFoundError:
+                path = path.with_name(path.name + ".zst")
+                if not path.exists():
+                    logging.warning("Audit log segment %s disappeared while reading", path.stem)
+                    return None
+        if zstandard is None:
+            logging.warning("Skipping compressed audit log %s: zstandard not available", path.name)
+            return None
+        return zstandard.open(path, "rt", encoding="utf-8")
+
     def _generate_hashes(self, file_path: Path) -> tuple[str, int]:
         """Calculates the SHA-256 hash and size of a file."""
         if not file_path.exists():
@@ -62,16 +402,49 @@ class AuditLogger:
 
     def log_event(self, event_data: dict):
         """
-        Logs a sanitization event in both TXT and JSON formats.
+        Logs a sanitization event as a JSON record.
+        The file is written asynchronously; use flush() to wait for it.
 
         Args:
             event_data (dict): A dictionary containing all relevant information
                                about the sanitization event.
         """
-        logging.info(f"[AUDIT_LOG_EVENT] Starting audit log for event")
+        self.log_events([self.prepare_event(event_data)])
+
+    def log_events(self, events: list):
+        """
+        Logs several prepared events, written together in a single batch.
+        The file is written asynchronously; use flush() to wait for it.
+
+        Args:
+            events (list): Events returned by prepare_event().
+        """
+        if not events:
+            return
+        if self._closed:
+            logging.error("[AUDIT_LOG_EVENT] Audit logger is closed; %s event(s) not logged", len(events))
+            return
+        # Copy so the caller can reuse its list once this returns
+        self._queue.put(list(events))
+        logging.info("[AUDIT_LOG_EVENT] Queued %s audit event(s) for writing", len(events))
+
+    def prepare_event(self, event_data: dict) -> dict:
+        """
+        Enriches event data with its event id, timestamp, workstation and file
+        hashes. Call this when the event happens, so the id, timestamp and hashes
+        reflect that moment even if the event is logged later with log_events().
+
+        Args:
+            event_data (dict): A dictionary containing all relevant information
+                               about the sanitization event.
+
+        Returns:
+            dict: The enriched event, ready for log_events().
+        """
+        logging.info("[AUDIT_LOG_EVENT] Starting audit log for event")
         timestamp = datetime.now()
         event_id = f"STZ-{timestamp.strftime('%Y%m%d')}-{timestamp.strftime('%H%M%S%f')[:-3]}"
-        logging.info(f"[AUDIT_LOG_EVENT] Generated event_id: {event_id}")
+        logging.info("[AUDIT_LOG_EVENT] Generated event_id: %s", event_id)
         
         # Enrich the event data with standard fields
         full_event = {
@@ -80,82 +453,80 @@ class AuditLogger:
             "workstation_id": socket.gethostname(),
             **event_data
         }
-        logging.info(f"[AUDIT_LOG_EVENT] Event enriched with timestamp and workstation")
+        logging.info("[AUDIT_LOG_EVENT] Event enriched with timestamp and workstation")
         
         # Calculate hashes for original and sanitized files if paths are provided
         if full_event.get("document", {}).get("original_path"):
             path = Path(full_event["document"]["original_path"])
-            logging.info(f"[AUDIT_LOG_EVENT] Calculating hash for original file: {path}")
+            logging.info("[AUDIT_LOG_EVENT] Calculating hash for original file: %s", path)
             h, s = self._generate_hashes(path)
             full_event["document"]["original_hash_sha256"] = h
             full_event["document"]["original_size_bytes"] = s
-            logging.info(f"[AUDIT_LOG_EVENT] Original file hash: {h[:16]}..., size: {s}")
+            logging.info("[AUDIT_LOG_EVENT] Original file hash: %s..., size: %s", h[:16], s)
 
         if full_event.get("document", {}).get("sanitized_path"):
             path = Path(full_event["document"]["sanitized_path"])
-            logging.info(f"[AUDIT_LOG_EVENT] Calculating hash for sanitized file: {path}")
+            logging.info("[AUDIT_LOG_EVENT] Calculating hash for sanitized file: %s", path)
             h, s = self._generate_hashes(path)
             full_event["document"]["sanitized_hash_sha256"] = h
             full_event["document"]["sanitized_size_bytes"] = s
-            logging.info(f"[AUDIT_LOG_EVENT] Sanitized file hash: {h[:16]}..., size: {s}")
+            logging.info("[AUDIT_LOG_EVENT] Sanitized file hash: %s..., size: %s", h[:16], s)
         
-        logging.info(f"[AUDIT_LOG_EVENT] About to write JSON log to {self.log_dir}")
-        self._write_json_log(full_event, event_id)
-        logging.info(f"[AUDIT_LOG_EVENT] About to write TXT log to {self.log_dir}")
-        self._write_txt_log(full_event, event_id)
-        logging.info(f"[AUDIT_LOG_EVENT] Completed audit logging for event_id: {event_id}")
-
-    def _write_json_log(self, event: dict, event_id: str):
-        """Writes the structured JSON log file."""
-        log_file = self.log_dir / f"{event_id}.json"
+        # Hashes are taken above, on the caller's thread, while the files
+        # are guaranteed to exist; only the disk writes are deferred.
+        return full_event
+
+    def _serialize_event(self, event: dict) -> bytes:
+        """
+        Serializes the structured JSON record as a single line. Non-str keys
+        are written as strings; a record orjson still rejects (such as an
+        integer beyond 64 bits) is encoded with the json module instead.
+        Raises TypeError or ValueError if neither can encode it.
+        """
         try:
-            # Create a clean copy for JSON serialization (remove Path objects etc.)
-            json_safe_event = json.loads(json.dumps(event, default=str)) 
-            with open(log_file, 'w') as f:
-                json.dump(json_safe_event, f, indent=2)
-            logging.info(f"Successfully wrote JSON audit log: {log_file}")
-        except Exception as e:
-            logging.error(f"Failed to write JSON audit log {log_file}: {e}")
+            return orjson.dumps(
+                event, default=str, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            return json.dumps(event, default=str).encode("utf-8") + b"\n"
 
-    def _write_txt_log(self, event: dict, event_id: str):
-        """Writes the human-readable text log file."""
-        log_file = self.log_dir / f"{event_id}.txt"
+    def render_txt(self, event: dict) -> str:
+        """Builds the human-readable report for a single JSON audit record."""
         doc = event.get("document", {})
+        lines = [
+            "-"*75,
+            "PDF SANITIZATION REPORT",
+            f"Date: {event['timestamp']}",
+            "-"*75,
+            f"Document: {doc.get('original_name', 'N/A')}",
+            f"Original Size: {doc.get('original_size_bytes', 0)} bytes",
+            f"Sanitized Size: {doc.get('sanitized_size_bytes', 0)} bytes",
+            f"Processing Time: {doc.get('processing_time_ms', 0)} ms",
+            "",
+        ]
         
-        try:
-            # Use utf-8 encoding to support special characters including Greek
-            with open(log_file, 'w', encoding='utf-8') as f:
-                f.write("-"*75 + "\n")
-                f.write("PDF SANITIZATION REPORT\n")
-                f.write(f"Date: {event['timestamp']}\n")
-                f.write("-"*75 + "\n")
-                f.write(f"Document: {doc.get('original_name', 'N/A')}\n")
-                f.write(f"Original Size: {doc.get('original_size_bytes', 0)} bytes\n")
-                f.write(f"Sanitized Size: {doc.get('sanitized_size_bytes', 0)} bytes\n")
-                f.write(f"Processing Time: {doc.get('processing_time_ms', 0)} ms\n\n")
-                
-                threats_list = event.get('threats_detected', [])
-                threats_count = len(threats_list)
-                if threats_count > 0:
-                    threat_types = [threat.get('type', 'N/A') for threat in threats_list]
-                    threat_types_str = ", ".join(threat_types)
-                    f.write(f"THREATS DETECTED: {threats_count} total - Types: {threat_types_str}\n")
-                else:
-                    f.write(f"THREATS DETECTED: None\n")
-                for threat in threats_list:
-                    f.write(f"  [{threat.get('severity', 'UNKNOWN')}] {threat.get('type', 'N/A')}\n")
-                    f.write(f"    Action: {threat.get('action', 'N/A')}\n")
-                
-                status = "SUCCESS" if event.get('status') == "SUCCESS" else "FAILED"
-                f.write(f"\nSANITIZATION STATUS: {status}\n")
-                f.write(f"Original Hash (SHA-256): {doc.get('original_hash_sha256', 'N/A')}\n")
-                f.write(f"Sanitized Hash (SHA-256): {doc.get('sanitized_hash_sha256', 'N/A')}\n")
-                f.write("-"*75 + "\n")
-                f.write(f"Operator: {event.get('operator', 'N/A')} | Workstation: {event.get('workstation_id', 'N/A')}\n")
-            
-            logging.info(f"Successfully wrote TXT audit log: {log_file}")
-        except Exception as e:
-            logging.error(f"Failed to write TXT audit log {log_file}: {e}")
+        threats_list = event.get('threats_detected', [])
+        threats_count = len(threats_list)
+        if threats_count > 0:
+            threat_types = [threat.get('type', 'N/A') for threat in threats_list]
+            threat_types_str = ", ".join(threat_types)
+            lines.append(f"THREATS DETECTED: {threats_count} total - Types: {threat_types_str}")
+        else:
+            lines.append(f"THREATS DETECTED: None")
+        for threat in threats_list:
+            lines.append(f"  [{threat.get('severity', 'UNKNOWN')}] {threat.get('type', 'N/A')}")
+            lines.append(f"    Action: {threat.get('action', 'N/A')}")
+        
+        status = "SUCCESS" if event.get('status') == "SUCCESS" else "FAILED"
+        lines.extend([
+            "",
+            f"SANITIZATION STATUS: {status}",
+            f"Original Hash (SHA-256): {doc.get('original_hash_sha256', 'N/A')}",
+            f"Sanitized Hash (SHA-256): {doc.get('sanitized_hash_sha256', 'N/A')}",
+            "-"*75,
+            f"Operator: {event.get('operator', 'N/A')} | Workstation: {event.get('workstation_id', 'N/A')}",
+        ])
+        return "\n".join(lines) + "\n"
 
 # Example Usage
 if __name__ == '__main__':
@@ -193,4 +564,6 @@ if __name__ == '__main__':
     }
     
     logger.log_event(test_event)
-    print("\nAudit logs generated in the 'logs' directory.")
+    logger.close()
+    print(f"\nAudit log appended to {logger.json_log_path}.")
+    print(logger.render_txt(logger.recent_logs(1)[0]))
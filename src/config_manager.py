@@ -65,7 +65,7 @@ def verify_config(config_data: Dict[str, Any], signature_hex: str, public_key) -
         public_key.verify(signature, canonical_json, ec.ECDSA(hashes.SHA256()))
         return True
     except (InvalidSignature, ValueError, TypeError) as e:
-        logging.warning(f"Configuration signature verification failed: {e}")
+        logging.warning("Configuration signature verification failed: %s", e)
         return False
 
 
@@ -152,7 +152,7 @@ class ConfigManager:
             value: The value to set.
         """
         self.config[key] = value
-        self.logger.info(f"Configuration updated: {key} = {value}")
+        self.logger.info("Configuration updated: %s = %s", key, value)
     
     def validate_config(self) -> bool:
         """
@@ -164,7 +164,7 @@ class ConfigManager:
         required_keys = DEFAULT_CONFIG.keys()
         for key in required_keys:
             if key not in self.config:
-                self.logger.error(f"Missing required configuration key: {key}")
+                self.logger.error("Missing required configuration key: %s", key)
                 return False
         
         # Validate numeric ranges
@@ -4,10 +4,17 @@ Description: Contains the primary PDF parsing, whitelisting, and reconstruction
              logic. This is the heart of the sanitization process.
 """
 
-import pikepdf
-from pikepdf import Pdf, PdfImage
+from __future__ import annotations
+
 from decimal import Decimal
 import logging
+from typing import TYPE_CHECKING
+
+# pikepdf is imported where it is first needed, so importing this module
+# (e.g. for the whitelist definitions) does not load it
+if TYPE_CHECKING:
+    import pikepdf
+    from pikepdf import Pdf
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -44,36 +51,52 @@ class PDFWhitelistParser:
             "pages": []
         }
         self.original_pdf = None
+        import pikepdf
         try:
             try:
-                self.pdf = Pdf.open(self.pdf_path, allow_overwriting_input=True)
+                self.pdf = pikepdf.Pdf.open(self.pdf_path, allow_overwriting_input=True)
                 self.original_pdf = self.pdf  # Keep reference to original for extraction
             except pikepdf.PasswordError:
                 raise ValueError("The PDF file is encrypted and cannot be opened without a password.")
         except Exception as e:
-            logging.error(f"Failed to open PDF {pdf_path}: {e}")
+            logging.error("Failed to open PDF %s: %s", pdf_path, e)
             raise
 
+    @classmethod
+    def from_pdf(cls, pdf: Pdf, source_path: str) -> PDFWhitelistParser:
+        """
+        Creates a parser over an already-open document instead of opening
+        source_path again. The caller keeps ownership of the handle.
+        """
+        parser = cls.__new__(cls)
+        parser.pdf_path = source_path
+        parser.whitelisted_data = {
+            "pages": []
+        }
+        parser.pdf = pdf
+        parser.original_pdf = pdf
+        return parser
+
     def parse(self):
         """
         Executes the parsing and whitelisting process.
         Returns extracted page data with binary content preserved.
         """
-        logging.info(f"Starting whitelist parsing for {self.pdf_path}")
+        logging.info("Starting whitelist parsing for %s", self.pdf_path)
         try:
             if not hasattr(self.pdf, 'pages') or self.pdf.pages is None:
-                logging.warning(f"PDF has no pages property, creating empty page list")
+                logging.warning("PDF has no pages property, creating empty page list")
                 self.whitelisted_data["pages"] = []
                 return self.whitelisted_data
             
             total_pages = len(self.pdf.pages)
             for i, page in enumerate(self.pdf.pages):
                 try:
-                    logging.info(f"Processing page {i+1}/{total_pages}")
+                    logging.info("Processing page %s/%s", i + 1, total_pages)
                     page_content = self._extract_whitelisted_page_content(page)
                     self.whitelisted_data["pages"].append(page_content)
                 except Exception as e:
-                    logging.error(f"Error processing page {i+1}: {e}", exc_info=True)
+                    logging.error("Error processing page %s: %s", i + 1, e, exc_info=True)
                     # Add empty page as fallback
                     self.whitelisted_data["pages"].append({
                         "mediabox": [0, 0, 612, 792],
@@ -81,10 +104,10 @@ class PDFWhitelistParser:
                         "contents": None
                     })
                 
-            logging.info(f"Whitelist parsing complete for {self.pdf_path}")
+            logging.info("Whitelist parsing complete for %s", self.pdf_path)
             return self.whitelisted_data
         except Exception as e:
-            logging.error(f"Critical error during parsing: {e}", exc_info=True)
+            logging.error("Critical error during parsing: %s", e, exc_info=True)
             raise
 
     def get_original_pdf(self):
@@ -114,7 +137,7 @@ class PDFWhitelistParser:
                 "has_contents": hasattr(page, 'Contents') and page.Contents is not None
             }
         except Exception as e:
-            logging.warning(f"Error reading page properties: {e}, using defaults")
+            logging.warning("Error reading page properties: %s, using defaults", e)
             content = {
                 "mediabox": [0, 0, 612, 792],
                 "resources": {},
@@ -126,7 +149,7 @@ class PDFWhitelistParser:
             try:
                 content["resources"] = self._extract_whitelisted_resources(page.Resources)
             except Exception as e:
-                logging.warning(f"Could not extract resources: {e}")
+                logging.warning("Could not extract resources: %s", e)
                 content["resources"] = {"/Font": {}, "/XObject": {}}
 
         return content
@@ -144,6 +167,9 @@ class PDFWhitelistParser:
         if not resources:
             return result
         
+        # Checked once per page rather than on every resource below
+        log_debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+        
         try:
             # Extract Font resources (standard fonts are safe)
             if hasattr(resources, 'Font') and resources.Font:
@@ -154,11 +180,13 @@ class PDFWhitelistParser:
                             font_name_str = str(font_name)
                             basefont = str(font_obj.BaseFont) if hasattr(font_obj, 'BaseFont') else "Unknown"
                             result["/Font"][font_name_str] = {"BaseFont": basefont}
-                            logging.debug(f"Extracted font: {font_name_str}")
+                            if log_debug:
+                                logging.debug("Extracted font: %s", font_name_str)
                         except Exception as e:
-                            logging.debug(f"Error storing font {font_name}: {e}")
+                            if log_debug:
+                                logging.debug("Error storing font %s: %s", font_name, e)
                 except Exception as e:
-                    logging.warning(f"Error extracting fonts: {e}")
+                    logging.warning("Error extracting fonts: %s", e)
             
             # Extract XObjects (images are safe if they're just pixel data)
             if hasattr(resources, 'XObject') and resources.XObject:
@@ -181,21 +209,23 @@ class PDFWhitelistParser:
                                         "Height": height,
                                         "ColorSpace": colorspace
                                     }
-                                    logging.debug(f"Extracted image: {xobj_name_str}")
-                                else:
-                                    logging.debug(f"Skipped non-image XObject: {xobj_name} (type: {subtype})")
+                                    if log_debug:
+                                        logging.debug("Extracted image: %s", xobj_name_str)
+                                elif log_debug:
+                                    logging.debug("Skipped non-image XObject: %s (type: %s)", xobj_name, subtype)
                             else:
                                 # No Subtype - include as metadata
                                 xobj_name_str = str(xobj_name)
                                 result["/XObject"][xobj_name_str] = {"type": "XObject"}
-                                logging.debug(f"Extracted XObject without Subtype: {xobj_name_str}")
+                                if log_debug:
+                                    logging.debug("Extracted XObject without Subtype: %s", xobj_name_str)
                         except Exception as e:
-                            logging.warning(f"Error checking XObject {xobj_name}: {e}")
+                            logging.warning("Error checking XObject %s: %s", xobj_name, e)
                 except Exception as e:
-                    logging.warning(f"Error extracting XObjects: {e}")
+                    logging.warning("Error extracting XObjects: %s", e)
         
         except Exception as e:
-            logging.error(f"Error in _extract_whitelisted_resources: {e}")
+            logging.error("Error in _extract_whitelisted_resources: %s", e)
             return {"/Font": {}, "/XObject": {}}
         
         return result
@@ -209,28 +239,42 @@ class PDFReconstructor:
     def __init__(self, whitelisted_data: dict, original_pdf: Pdf = None):
         self.data = whitelisted_data
         self.original_pdf = original_pdf
+        from pikepdf import Pdf
         self.new_pdf = Pdf.new()
 
-    def build(self, output_path: str):
+    @property
+    def pdf(self) -> Pdf:
+        """
+        The reconstructed document. It stays open after build() so callers can
+        inspect it without re-parsing the saved file.
+        """
+        return self.new_pdf
+
+    def build(self, output_path: str, keep_open: bool = True):
         """
         Builds the new PDF by copying pages from the original PDF with whitelisted structure.
         Preserves actual content while removing metadata threats.
+
+        Args:
+            output_path (str): Where to save the sanitized PDF.
+            keep_open (bool): Keep the in-memory document available as self.pdf
+                after saving. Pass False to release it immediately.
         """
-        logging.info(f"Reconstructing new PDF from whitelisted data.")
+        logging.info("Reconstructing new PDF from whitelisted data.")
         
         try:
             from pikepdf import Dictionary, Name, Array
             
             # If we have the original PDF, copy pages directly to preserve all content
             if self.original_pdf:
-                logging.info(f"Copying {len(self.original_pdf.pages)} pages from original PDF")
+                logging.info("Copying %s pages from original PDF", len(self.original_pdf.pages))
                 try:
                     # Use pikepdf's extend method to copy pages efficiently
                     # This preserves all content streams and resources
                     self.new_pdf.pages.extend(self.original_pdf.pages)
-                    logging.info(f"Successfully copied all {len(self.original_pdf.pages)} pages from original PDF")
+                    logging.info("Successfully copied all %s pages from original PDF", len(self.original_pdf.pages))
                 except Exception as e:
-                    logging.warning(f"Error copying pages: {e}, creating blank pages")
+                    logging.warning("Error copying pages: %s, creating blank pages", e)
                     # Fallback: create blank pages with proper structure
                     for i, page_data in enumerate(self.data["pages"]):
                         try:
@@ -247,7 +291,7 @@ class PDFReconstructor:
                             if 'ProcSet' not in page.Resources:
                                 page.Resources.ProcSet = Array([Name.PDF, Name.Text, Name.ImageB, Name.ImageC, Name.ImageI])
                         except Exception as e2:
-                            logging.warning(f"Error creating blank page {i+1}: {e2}")
+                            logging.warning("Error creating blank page %s: %s", i + 1, e2)
             else:
                 logging.warning("No original PDF provided, creating blank pages")
                 # Fallback: create blank pages with metadata from whitelisted data
@@ -285,17 +329,20 @@ class PDFReconstructor:
             except (KeyError, AttributeError):
                 pass
                 
-            logging.info(f"Saving reconstructed PDF to {output_path}")
+            logging.info("Saving reconstructed PDF to %s", output_path)
             self.new_pdf.save(output_path)
-            logging.info(f"PDF successfully saved to {output_path}")
+            logging.info("PDF successfully saved to %s", output_path)
+            if not keep_open:
+                self.new_pdf.close()
             
         except Exception as e:
-            logging.error(f"Failed to reconstruct PDF: {e}", exc_info=True)
+            logging.error("Failed to reconstruct PDF: %s", e, exc_info=True)
             raise
 
 # Example Usage (for testing)
 if __name__ == '__main__':
     # Create a dummy PDF with pikepdf for testing purposes
+    from pikepdf import Pdf
     pdf = Pdf.new()
     page = pdf.new_page()
     pdf.pages.append(page)
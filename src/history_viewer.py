@@ -14,6 +14,11 @@ class HistoryViewer(QWidget):
         self.layout = QVBoxLayout(self)
         self.history_list_widget = QListWidget()
         self.layout.addWidget(self.history_list_widget)
+        # Audit logger mark of the last event shown, see refresh_history()
+        self._written_mark = 0
+        # (event_id, timestamp) of every event shown, so an event written
+        # while the log files were being read is not listed twice
+        self._shown = set()
 
         self.populate_history()
 
@@ -22,33 +27,58 @@ class HistoryViewer(QWidget):
         Populates the history list with past sanitization events from the
         audit log directory. Clears existing items before repopulating.
         """
-        logging.info(f"[HISTORY_VIEWER] populate_history called")
-        logging.info(f"[HISTORY_VIEWER] Log directory: {self.audit_logger.log_dir}")
+        logging.info("[HISTORY_VIEWER] populate_history called")
+        logging.info("[HISTORY_VIEWER] Log directory: %s", self.audit_logger.log_dir)
         
         # Clear existing items
         self.history_list_widget.clear()
+        self._shown.clear()
+        
+        # Make sure events queued by the background writer are on disk
+        self.audit_logger.flush()
+        # Taken before reading the files, so nothing written meanwhile is missed
+        self._written_mark = self.audit_logger.written_mark()
         
         # Verify log directory exists
         if not self.audit_logger.log_dir.exists():
-            logging.warning(f"[HISTORY_VIEWER] Log directory does not exist: {self.audit_logger.log_dir}")
+            logging.warning("[HISTORY_VIEWER] Log directory does not exist: %s", self.audit_logger.log_dir)
             return
         
-        log_files = sorted(
-            self.audit_logger.log_dir.glob("*.json"),
-            key=lambda f: f.stat().st_mtime,
-            reverse=True
-        )
+        # Reads rotated (possibly zstd-compressed) segments and the active
+        # log, oldest first; show newest first
+        events = list(self.audit_logger.iter_events())
+        if not events:
+            logging.info("[HISTORY_VIEWER] No audit events yet in %s", self.audit_logger.log_dir)
+            return
         
-        logging.info(f"[HISTORY_VIEWER] Found {len(log_files)} log files")
+        logging.info("[HISTORY_VIEWER] Found %s audit events", len(events))
 
-        for log_file in log_files:
-            logging.info(f"[HISTORY_VIEWER] Adding log file: {log_file.name}")
-            item = QListWidgetItem(log_file.name)
-            self.history_list_widget.addItem(item)
+        for event in reversed(events):
+            self._add_event(event, self.history_list_widget.count())
     
     def refresh_history(self):
         """
         Refreshes the history display. Called whenever new events are logged.
+        Only the events written since the last refresh are added, taken from
+        the audit logger's in-memory index; the log files are read again
+        only if that index no longer holds all of them.
         """
-        logging.info(f"[HISTORY_VIEWER] refresh_history called")
-        self.populate_history()
+        logging.info("[HISTORY_VIEWER] refresh_history called")
+        self.audit_logger.flush()
+        events, self._written_mark = self.audit_logger.events_since(self._written_mark)
+        if events is None:
+            self.populate_history()
+            return
+        # Oldest first, each inserted on top, so the newest ends up first
+        for event in events:
+            self._add_event(event, 0)
+
+    def _add_event(self, event: dict, row: int):
+        """Inserts one audit event at row unless it is already listed."""
+        key = (event.get('event_id'), event.get('timestamp'))
+        if key in self._shown:
+            return
+        self._shown.add(key)
+        label = f"{event.get('event_id', 'N/A')} - {event.get('document', {}).get('original_name', 'N/A')}"
+        logging.info("[HISTORY_VIEWER] Adding event: %s", label)
+        self.history_list_widget.insertItem(row, QListWidgetItem(label))
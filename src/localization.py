@@ -4,6 +4,8 @@ Description: Provides multilingual support for the PDF Sanitizer application.
 Currently supports English and Greek languages.
 """
 
+import functools
+
 # Language codes
 ENGLISH = 'en'
 GREEK = 'el'
@@ -222,7 +224,7 @@ class Localization:
     
     def __init__(self, language=ENGLISH):
         """Initialize with specified language (default: English)"""
-        self.language = language if language in SUPPORTED_LANGUAGES else ENGLISH
+        self.set_language(language)
     
     def set_language(self, language_code):
         """Set the current language"""
@@ -230,6 +232,8 @@ class Localization:
             self.language = language_code
         else:
             self.language = ENGLISH
+        # Flat key -> text table for this language, so a lookup is one dict access
+        self._table = _TABLES[self.language]
     
     def get_language(self):
         """Get the current language code"""
@@ -249,30 +253,68 @@ class Localization:
             localization.t('status_added_to_queue', 'file.pdf')
             localization.t('dialog_clear_queue_message', 5)
         """
-        if key not in self.TRANSLATIONS:
-            return key  # Return key if translation not found
-        
-        text = self.TRANSLATIONS[key].get(self.language, self.TRANSLATIONS[key].get(ENGLISH, key))
-        
-        # Format with positional arguments
-        if args:
-            try:
-                return text.format(*args)
-            except (IndexError, KeyError):
-                return text
-        
-        # Format with keyword arguments
-        if kwargs:
+        # Lookups are pure, so positional calls with hashable arguments are
+        # memoized; keyword or unhashable arguments take the uncached path
+        if not kwargs:
             try:
-                return text.format(**kwargs)
-            except KeyError:
-                return text
-        
-        return text
+                return _translate_cached(self.language, key, *args)
+            except TypeError:
+                pass
+        return _translate(self._table, key, args, kwargs)
     
     def get_all_keys(self):
-        """Get all available translation keys"""
-        return list(self.TRANSLATIONS.keys())
+        """Get all available translation keys (an immutable, shared tuple)"""
+        return _ALL_KEYS
+
+
+# All translation keys, computed once
+_ALL_KEYS = tuple(Localization.TRANSLATIONS)
+
+# Keys whose text is the same in every language (units, symbols, etc.)
+NO_TRANSLATION_KEYS = frozenset({
+    'settings_memory_suffix', 'settings_timeout_suffix', 'dialog_pdf_filter'
+})
+
+# Per-language tables flattened from Localization.TRANSLATIONS, with English
+# filled in for any string missing a translation
+_TABLES = {
+    language: {
+        key: entry.get(language, entry.get(ENGLISH, key))
+        for key, entry in Localization.TRANSLATIONS.items()
+    }
+    for language in SUPPORTED_LANGUAGES
+}
+
+
+def _translate(table, key, args, kwargs):
+    """Looks up and formats a translation (the uncached body of Localization.t)."""
+    text = table.get(key)
+    if text is None:
+        return key  # Return key if translation not found
+    
+    # Format with positional arguments
+    if args:
+        try:
+            return text.format(*args)
+        except (IndexError, KeyError):
+            return text
+    
+    # Format with keyword arguments
+    if kwargs:
+        try:
+            return text.format(**kwargs)
+        except KeyError:
+            return text
+    
+    return text
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _translate_cached(language, key, *args):
+    """
+    Memoized _translate for calls without keyword arguments. The arguments
+    are passed individually so typed=True keeps 1, 1.0 and True apart.
+    """
+    return _translate(_TABLES[language], key, args, None)
 
 
 # Global localization instance
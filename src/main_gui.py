@@ -31,7 +31,7 @@ class MainWindow(QMainWindow):
         
         # Initialize core components
         self.config_manager = ConfigManager()
-        logging.info(f"[MAIN_GUI_INIT] ConfigManager initialized")
+        logging.info("[MAIN_GUI_INIT] ConfigManager initialized")
         
         # Initialize localization with saved language
         self.localization = get_localization(self.config_manager.get("language", ENGLISH))
@@ -40,19 +40,19 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(1000, 700)
 
         self.sandboxed_parser = SandboxedPDFParser()
-        logging.info(f"[MAIN_GUI_INIT] SandboxedPDFParser initialized")
+        logging.info("[MAIN_GUI_INIT] SandboxedPDFParser initialized")
         
         log_dir = self.config_manager.get("log_directory")
-        logging.info(f"[MAIN_GUI_INIT] Creating AuditLogger with log_directory: {log_dir}")
+        logging.info("[MAIN_GUI_INIT] Creating AuditLogger with log_directory: %s", log_dir)
         self.audit_logger = AuditLogger(
             log_directory=log_dir,
             language=self.config_manager.get("language", ENGLISH)
         )
-        logging.info(f"[MAIN_GUI_INIT] AuditLogger initialized: {self.audit_logger}")
+        logging.info("[MAIN_GUI_INIT] AuditLogger initialized: %s", self.audit_logger)
         
-        logging.info(f"[MAIN_GUI_INIT] Creating QueueManager with audit_logger: {self.audit_logger}")
+        logging.info("[MAIN_GUI_INIT] Creating QueueManager with audit_logger: %s", self.audit_logger)
         self.queue_manager = QueueManager(self.sandboxed_parser, self.audit_logger)
-        logging.info(f"[MAIN_GUI_INIT] QueueManager initialized")
+        logging.info("[MAIN_GUI_INIT] QueueManager initialized")
         
         self.usb_monitor = USBIsolationMonitor()
 
@@ -264,7 +264,7 @@ class MainWindow(QMainWindow):
         self.file_list_widget.addItem(item)
         # Update status with queue size
         queue_size = len(self.queue_manager.queue) if self.queue_manager.queue else 0
-        logging.info(f"Queue size: {queue_size}")
+        logging.info("Queue size: %s", queue_size)
 
     @pyqtSlot(str)
     def on_processing_started(self, file_path):
@@ -310,7 +310,7 @@ class MainWindow(QMainWindow):
                     self.reports_tab.display_report(report_data)
                     self.tab_widget.setCurrentWidget(self.reports_tab)
                 except Exception as e:
-                    logging.warning(f"Could not display report: {e}")
+                    logging.warning("Could not display report: %s", e)
             else:
                 error_msg = f"✗ Failed to sanitize: {file_path}"
                 if message:
@@ -326,7 +326,7 @@ class MainWindow(QMainWindow):
                     detailed_message
                 )
         except Exception as e:
-            logging.error(f"Error in on_processing_finished: {e}", exc_info=True)
+            logging.error("Error in on_processing_finished: %s", e, exc_info=True)
             self.status_bar.showMessage(f"UI Error: {str(e)}", 5000)
 
     def _show_about(self):
@@ -346,7 +346,7 @@ class MainWindow(QMainWindow):
             else:
                 self.status_bar.showMessage(self.localization.t('status_queue_empty'), 3000)
         except Exception as e:
-            logging.error(f"Error processing queue: {e}", exc_info=True)
+            logging.error("Error processing queue: %s", e, exc_info=True)
             from PyQt6.QtWidgets import QMessageBox
             QMessageBox.critical(
                 self,
@@ -373,7 +373,7 @@ class MainWindow(QMainWindow):
             else:
                 self.status_bar.showMessage(self.localization.t('status_queue_empty'), 3000)
         except Exception as e:
-            logging.error(f"Error clearing queue: {e}", exc_info=True)
+            logging.error("Error clearing queue: %s", e, exc_info=True)
             from PyQt6.QtWidgets import QMessageBox
             QMessageBox.critical(self, "Error", f"Failed to clear queue:\n{str(e)}")
 
@@ -389,7 +389,7 @@ class MainWindow(QMainWindow):
                     self.usb_monitor.stop_monitoring()
                     logging.info("USB monitoring stopped successfully")
                 except Exception as e:
-                    logging.error(f"Error stopping USB monitor: {e}", exc_info=True)
+                    logging.error("Error stopping USB monitor: %s", e, exc_info=True)
             
             # Step 2: Stop queue processing
             logging.info("Step 2: Stopping queue processing")
@@ -400,16 +400,17 @@ class MainWindow(QMainWindow):
                         self.queue_manager.queue.clear()
                     logging.info("Queue cleared successfully")
                 except Exception as e:
-                    logging.error(f"Error stopping queue manager: {e}", exc_info=True)
+                    logging.error("Error stopping queue manager: %s", e, exc_info=True)
             
             # Step 3: Cleanup audit logger resources
             logging.info("Step 3: Cleaning up audit logger resources")
             if hasattr(self, 'audit_logger') and self.audit_logger:
                 try:
                     # Flush any pending audit logs
+                    self.audit_logger.flush()
                     logging.info("Audit logger cleanup complete")
                 except Exception as e:
-                    logging.error(f"Error cleaning audit logger: {e}", exc_info=True)
+                    logging.error("Error cleaning audit logger: %s", e, exc_info=True)
             
             # Step 4: Cleanup sandboxed parser resources
             logging.info("Step 4: Cleaning up sandboxed parser resources")
@@ -419,7 +420,7 @@ class MainWindow(QMainWindow):
                         self.sandboxed_parser.cleanup()
                     logging.info("Sandboxed parser cleanup complete")
                 except Exception as e:
-                    logging.error(f"Error cleaning sandboxed parser: {e}", exc_info=True)
+                    logging.error("Error cleaning sandboxed parser: %s", e, exc_info=True)
             
             # Step 5: Disconnect all signals to prevent callbacks during cleanup
             logging.info("Step 5: Disconnecting all signals")
@@ -439,14 +440,14 @@ class MainWindow(QMainWindow):
                         pass
                 logging.info("All signals disconnected successfully")
             except Exception as e:
-                logging.error(f"Error disconnecting signals: {e}", exc_info=True)
+                logging.error("Error disconnecting signals: %s", e, exc_info=True)
             
             # Step 6: Accept the close event
             logging.info("All cleanup operations completed, accepting close event")
             event.accept()
             
         except Exception as e:
-            logging.error(f"Unexpected error during application shutdown: {e}", exc_info=True)
+            logging.error("Unexpected error during application shutdown: %s", e, exc_info=True)
             # Still accept the event to ensure the application closes
             event.accept()
 
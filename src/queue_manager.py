@@ -28,7 +28,7 @@ class QueueManager(QObject):
     def add_file_to_queue(self, file_path: str):
         """Adds a file to the processing queue."""
         file_path = str(file_path)
-        logger.info(f"Adding file to queue: {file_path}")
+        logger.info("Adding file to queue: %s", file_path)
         self.queue.append(file_path)
         self.file_added_to_queue.emit(file_path)
 
@@ -39,7 +39,7 @@ class QueueManager(QObject):
             return
 
         file_path = self.queue[0]  # Peek at the item
-        logger.info(f"Processing file: {file_path}")
+        logger.info("Processing file: %s", file_path)
         self.processing_started.emit(file_path)
 
         start_time = time.time()
@@ -52,7 +52,7 @@ class QueueManager(QObject):
                 return
             
             # Step 1: Parse PDF
-            logger.info(f"Parsing PDF: {file_path}")
+            logger.info("Parsing PDF: %s", file_path)
             try:
                 result = self.sandboxed_parser.parse_pdf_isolated(file_path)
             except Exception as e:
@@ -63,7 +63,7 @@ class QueueManager(QObject):
             
             if result.get("status") != "success":
                 error_msg = result.get("message", "Unknown parsing error")
-                logger.error(f"Parsing failed: {error_msg}")
+                logger.error("Parsing failed: %s", error_msg)
                 self._handle_error(file_path, error_msg, start_time)
                 return
 
@@ -71,12 +71,12 @@ class QueueManager(QObject):
             # The worker now handles both parsing and reconstruction
             output_file = result.get("output_file")
             if output_file and Path(output_file).exists():
-                logger.info(f"Using sanitized PDF created by worker: {output_file}")
+                logger.info("Using sanitized PDF created by worker: %s", output_file)
                 output_path = Path(output_file)
             else:
                 # Fallback: Reconstruct PDF if worker didn't create output file
                 # This should rarely happen with the new worker architecture
-                logger.warning(f"Worker did not provide output file, attempting local reconstruction")
+                logger.warning("Worker did not provide output file, attempting local reconstruction")
                 input_path = Path(file_path)
                 output_path = input_path.parent / f"{input_path.stem}_sanitized.pdf"
                 
@@ -92,12 +92,12 @@ class QueueManager(QObject):
                 
                 # If no write access, save to app directory
                 if not write_access:
-                    logger.warning(f"No write access to {input_path.parent}, using application directory")
+                    logger.warning("No write access to %s, using application directory", input_path.parent)
                     app_dir = Path(__file__).parent.parent
                     output_path = app_dir / f"{input_path.stem}_sanitized.pdf"
                 
                 # Re-parse and reconstruct locally
-                logger.info(f"Re-parsing and reconstructing PDF locally")
+                logger.info("Re-parsing and reconstructing PDF locally")
                 try:
                     from src.core_engine import PDFWhitelistParser, PDFReconstructor
                     
@@ -107,7 +107,7 @@ class QueueManager(QObject):
                     original_pdf = parser.get_original_pdf()
                     
                     # Reconstruct with proper data structure
-                    logger.info(f"Building sanitized PDF: {output_path}")
+                    logger.info("Building sanitized PDF: %s", output_path)
                     reconstructor = PDFReconstructor(whitelisted_data, original_pdf)
                     reconstructor.build(str(output_path))
                 except Exception as e:
@@ -137,7 +137,7 @@ class QueueManager(QObject):
             self.processing_count += 1
             
         except Exception as e:
-            logger.exception(f"Unexpected exception during processing: {e}")
+            logger.exception("Unexpected exception during processing: %s", e)
             self._handle_error(file_path, str(e), start_time)
 
     def _handle_error(self, file_path: str, error_msg: str, start_time: float):
@@ -154,13 +154,13 @@ class QueueManager(QObject):
 
     def _log_success(self, input_file: str, output_file: str, parse_result: dict, processing_time: float):
         """Log successful sanitization to audit logger."""
-        logger.info(f"[QM_LOG_SUCCESS] Starting audit log for successful sanitization")
-        logger.info(f"[QM_LOG_SUCCESS] Input: {input_file}, Output: {output_file}")
-        logger.info(f"[QM_LOG_SUCCESS] Audit logger object: {self.audit_logger}")
+        logger.info("[QM_LOG_SUCCESS] Starting audit log for successful sanitization")
+        logger.info("[QM_LOG_SUCCESS] Input: %s, Output: %s", input_file, output_file)
+        logger.info("[QM_LOG_SUCCESS] Audit logger object: %s", self.audit_logger)
         try:
             input_path = Path(input_file)
             output_path = Path(output_file)
-            logger.info(f"[QM_LOG_SUCCESS] Paths converted - input: {input_path}, output: {output_path}")
+            logger.info("[QM_LOG_SUCCESS] Paths converted - input: %s, output: %s", input_path, output_path)
             
             event_data = {
                 "operator": "pdf_sanitizer_system",
@@ -175,12 +175,14 @@ class QueueManager(QObject):
                 "sanitization_policy": "AGGRESSIVE",
                 "status": "SUCCESS"
             }
-            logger.info(f"[QM_LOG_SUCCESS] Event data prepared, calling audit_logger.log_event()")
+            logger.info("[QM_LOG_SUCCESS] Event data prepared, calling audit_logger.log_event()")
             
+            # Logged as soon as the file finishes; the audit writer thread
+            # already batches the disk writes
             self.audit_logger.log_event(event_data)
-            logger.info(f"[QM_LOG_SUCCESS] Audit logged for: {input_path.name}")
+            logger.info("[QM_LOG_SUCCESS] Audit logged for: %s", input_path.name)
         except Exception as e:
-            logger.error(f"[QM_LOG_SUCCESS] Failed to log audit event: {e}", exc_info=True)
+            logger.error("[QM_LOG_SUCCESS] Failed to log audit event: %s", e, exc_info=True)
 
     def _log_error(self, input_file: str, error_msg: str, processing_time: float):
         """Log processing error to audit logger."""
@@ -202,6 +204,6 @@ class QueueManager(QObject):
             }
             
             self.audit_logger.log_event(event_data)
-            logger.info(f"Error logged for: {input_path.name}")
+            logger.info("Error logged for: %s", input_path.name)
         except Exception as e:
-            logger.error(f"Failed to log error audit event: {e}")
+            logger.error("Failed to log error audit event: %s", e)
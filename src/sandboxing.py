@@ -5,13 +5,22 @@ Description: Handles the creation and management of isolated subprocesses for
              application.
 """
 
+import shutil
 import subprocess
 import tempfile
-import json
 from pathlib import Path
 import logging
 import sys
 import os
+import collections
+import struct
+import threading
+import time
+import uuid
+import weakref
+import ctypes
+
+import orjson
 
 try:
     import win32job
@@ -26,7 +35,35 @@ except ImportError:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 
-def create_limited_job_object(job_name: str, memory_limit_mb: int, cpu_time_limit_sec: int) -> int:
+# Job Object completion port messages (winnt.h)
+JOB_OBJECT_MSG_ACTIVE_PROCESS_ZERO = 4
+
+# Access rights needed to assign the worker to a Job Object
+_PROCESS_SET_QUOTA = 0x0100
+_PROCESS_TERMINATE = 0x0001
+
+_INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+# Toolhelp snapshot of every thread, and the access right to resume one
+_TH32CS_SNAPTHREAD = 0x00000004
+_THREAD_SUSPEND_RESUME = 0x0002
+
+
+class _THREADENTRY32(ctypes.Structure):
+    """THREADENTRY32 from tlhelp32.h."""
+    _fields_ = [
+        ("dwSize", ctypes.c_ulong),
+        ("cntUsage", ctypes.c_ulong),
+        ("th32ThreadID", ctypes.c_ulong),
+        ("th32OwnerProcessID", ctypes.c_ulong),
+        ("tpBasePri", ctypes.c_long),
+        ("tpDeltaPri", ctypes.c_long),
+        ("dwFlags", ctypes.c_ulong),
+    ]
+
+
+def create_limited_job_object(job_name: str, memory_limit_mb: int, cpu_time_limit_sec: int,
+                              completion_port: int = None, completion_key: int = 0) -> int:
     """
     Creates a Windows Job Object with strict resource limits.
 
@@ -34,6 +71,9 @@ def create_limited_job_object(job_name: str, memory_limit_mb: int, cpu_time_limi
         job_name (str): A unique name for the job object.
         memory_limit_mb (int): The maximum memory allocation for the job (in MB).
         cpu_time_limit_sec (int): The maximum CPU time for any process in the job (in seconds).
+        completion_port (int): Optional IO completion port handle to receive
+            job notifications (e.g. when the last process in the job exits).
+        completion_key (int): Completion key reported with those notifications.
 
     Returns:
         int: The handle to the created job object, or None if not available.
@@ -69,9 +109,167 @@ def create_limited_job_object(job_name: str, memory_limit_mb: int, cpu_time_limi
         win32job.JobObjectExtendedLimitInformation,
         limit_info
     )
-    logging.info(f"Created Windows Job Object '{job_name}' with {memory_limit_mb}MB memory limit")
+
+    if completion_port is not None:
+        win32job.SetInformationJobObject(
+            hjob,
+            win32job.JobObjectAssociateCompletionPortInformation,
+            {'CompletionKey': completion_key, 'CompletionPort': completion_port}
+        )
+    logging.info("Created Windows Job Object '%s' with %sMB memory limit", job_name, memory_limit_mb)
     return hjob
 
+# Result frame header written by the worker: 4-byte big-endian payload length
+_FRAME_HEADER = struct.Struct(">I")
+
+# Number of trailing worker stderr lines kept for error reporting
+STDERR_TAIL_LINES = 1000
+
+
+def _drain_stderr(stream, tail: collections.deque):
+    """Reads worker stderr line by line, keeping only the most recent lines."""
+    try:
+        for line in iter(stream.readline, b''):
+            tail.append(line.decode('utf-8', errors='replace').rstrip())
+    finally:
+        stream.close()
+
+
+def _read_exact(stream, size: int) -> bytes:
+    """Reads exactly size bytes from an unbuffered stream, or fewer on EOF."""
+    chunks = []
+    remaining = size
+    while remaining > 0:
+        chunk = stream.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _read_frame(stream, holder: list):
+    """Reads one length-prefixed frame from stream into holder, leaving it open."""
+    header = _read_exact(stream, _FRAME_HEADER.size)
+    if len(header) == _FRAME_HEADER.size:
+        (size,) = _FRAME_HEADER.unpack(header)
+        payload = _read_exact(stream, size)
+        if len(payload) == size:
+            holder.append(payload)
+
+
+def _read_result_frame(stream, holder: list):
+    """Reads one length-prefixed result frame from worker stdout into holder."""
+    try:
+        _read_frame(stream, holder)
+    finally:
+        stream.close()
+
+
+def _assign_to_job(hjob, process: subprocess.Popen):
+    """
+    Assigns a worker started with CREATE_SUSPENDED to a Job Object.
+
+    The worker has not run yet, so it cannot have exited or started children
+    of its own; any failure is a real error and is raised, and the caller
+    must kill the worker rather than let it run outside the job.
+    """
+    hprocess = win32api.OpenProcess(
+        _PROCESS_SET_QUOTA | _PROCESS_TERMINATE, False, process.pid
+    )
+    try:
+        win32job.AssignProcessToJobObject(hjob, hprocess)
+    finally:
+        win32api.CloseHandle(hprocess)
+
+
+def _resume_process(pid: int):
+    """
+    Resumes a process started with CREATE_SUSPENDED. Popen closes the
+    primary thread handle, so the thread is found through a Toolhelp
+    snapshot instead.
+    """
+    kernel32 = ctypes.windll.kernel32
+    kernel32.CreateToolhelp32Snapshot.restype = ctypes.c_void_p
+    kernel32.OpenThread.restype = ctypes.c_void_p
+    kernel32.ResumeThread.argtypes = [ctypes.c_void_p]
+    kernel32.ResumeThread.restype = ctypes.c_ulong
+    snapshot = kernel32.CreateToolhelp32Snapshot(_TH32CS_SNAPTHREAD, 0)
+    if snapshot == _INVALID_HANDLE_VALUE:
+        raise ctypes.WinError()
+    resumed = 0
+    try:
+        entry = _THREADENTRY32()
+        entry.dwSize = ctypes.sizeof(entry)
+        found = kernel32.Thread32First(ctypes.c_void_p(snapshot), ctypes.byref(entry))
+        while found:
+            if entry.th32OwnerProcessID == pid:
+                hthread = kernel32.OpenThread(_THREAD_SUSPEND_RESUME, False, entry.th32ThreadID)
+                if not hthread:
+                    raise ctypes.WinError()
+                try:
+                    if kernel32.ResumeThread(hthread) == 0xFFFFFFFF:
+                        raise ctypes.WinError()
+                finally:
+                    _close_handle(hthread)
+                resumed += 1
+            found = kernel32.Thread32Next(ctypes.c_void_p(snapshot), ctypes.byref(entry))
+    finally:
+        _close_handle(snapshot)
+    if not resumed:
+        raise RuntimeError(f"No threads found to resume in worker process {pid}")
+
+
+def _create_completion_port() -> int:
+    """Creates an IO completion port not bound to any file handle."""
+    kernel32 = ctypes.windll.kernel32
+    kernel32.CreateIoCompletionPort.restype = ctypes.c_void_p
+    kernel32.CreateIoCompletionPort.argtypes = [
+        ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_ulong
+    ]
+    port = kernel32.CreateIoCompletionPort(_INVALID_HANDLE_VALUE, None, 0, 1)
+    if not port:
+        raise ctypes.WinError()
+    return port
+
+
+def _close_handle(handle: int):
+    """Closes a raw Win32 handle created through ctypes."""
+    ctypes.windll.kernel32.CloseHandle(ctypes.c_void_p(handle))
+
+
+def _wait_for_job_exit(completion_port: int, timeout_seconds: float) -> bool:
+    """
+    Blocks on the job's completion port until no processes remain in the job.
+
+    Uses ctypes rather than win32file.GetQueuedCompletionStatus because job
+    notifications carry a process id in the OVERLAPPED slot, which pywin32
+    would try to interpret as an OVERLAPPED object.
+
+    Returns:
+        bool: True if the job emptied, False if the timeout elapsed first.
+    """
+    kernel32 = ctypes.windll.kernel32
+    kernel32.GetQueuedCompletionStatus.argtypes = [
+        ctypes.c_void_p, ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.c_size_t),
+        ctypes.POINTER(ctypes.c_void_p), ctypes.c_ulong
+    ]
+    message = ctypes.c_ulong()
+    key = ctypes.c_size_t()
+    overlapped = ctypes.c_void_p()
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        remaining_ms = max(0, int((deadline - time.monotonic()) * 1000))
+        ok = kernel32.GetQueuedCompletionStatus(
+            completion_port, ctypes.byref(message), ctypes.byref(key),
+            ctypes.byref(overlapped), remaining_ms
+        )
+        if not ok:
+            return False  # WAIT_TIMEOUT
+        if message.value == JOB_OBJECT_MSG_ACTIVE_PROCESS_ZERO:
+            return True
+
+
 class SandboxedPDFParser:
     """
     Manages the parsing of PDF files in a heavily restricted and isolated
@@ -94,6 +292,17 @@ class SandboxedPDFParser:
         self.worker_script_path = worker_script_path
         self.memory_limit_mb = memory_limit_mb
         self.cpu_time_limit_sec = cpu_time_limit_sec
+        # Private scratch directory, created once per parser and reused for
+        # every request. mkdtemp gives it a unique name and 0700 permissions,
+        # so another local user cannot pre-create, read or swap it.
+        self.scratch_dir = Path(tempfile.mkdtemp(prefix="pdf_sanitizer_"))
+        self._remove_scratch_dir = weakref.finalize(
+            self, shutil.rmtree, str(self.scratch_dir), ignore_errors=True
+        )
+
+    def cleanup(self):
+        """Removes the scratch directory. Also runs at garbage collection or exit."""
+        self._remove_scratch_dir()
 
     def parse_pdf_isolated(self, input_pdf_path: str, timeout_seconds: int = 300) -> dict:
         """
@@ -111,7 +320,10 @@ class SandboxedPDFParser:
             TimeoutError: If parsing exceeds the timeout.
             Exception: If the worker process fails or produces no results.
         """
-        temp_result_dir = Path(tempfile.mkdtemp(prefix="pdf_parse_"))
+        request_id = uuid.uuid4().hex
+        sanitized_pdf = self.scratch_dir / f"{request_id}.pdf"
+        hjob = None
+        completion_port = None
         
         try:
             # Get the path to the worker script relative to this module
@@ -120,53 +332,230 @@ class SandboxedPDFParser:
             if not worker_script.exists():
                 raise FileNotFoundError(f"Worker script not found at: {worker_script}")
             
-            logging.info(f"Starting isolated PDF parsing for: {input_pdf_path}")
-            logging.info(f"Worker script: {worker_script}")
-            logging.info(f"Output directory: {temp_result_dir}")
+            logging.info("Starting isolated PDF parsing for: %s", input_pdf_path)
+            logging.info("Worker script: %s", worker_script)
+            logging.info("Output file: %s", sanitized_pdf)
             
-            # Create worker process with constraints
+            # Create worker process with constraints. Worker logging goes to
+            # stderr and the result is a single length-prefixed frame on
+            # stdout. With Job Objects, completion is signalled by the job;
+            # the frame still carries the result so both paths return the
+            # same fields.
+            use_job_port = win32job is not None
+            worker_args = [
+                sys.executable,
+                str(worker_script),
+                "--input", input_pdf_path,
+                "--output", str(sanitized_pdf),
+                "--whitelist-mode", "strict"
+            ]
+            
+            creationflags = subprocess.CREATE_NEW_PROCESS_GROUP  # Windows only
+            if use_job_port:
+                # Start suspended and resume only once the worker is in the
+                # job, so it never runs without the limits. Anything it
+                # starts, such as the real interpreter behind a venv
+                # launcher, inherits the job.
+                creationflags |= win32process.CREATE_SUSPENDED
             process = subprocess.Popen(
-                [
-                    sys.executable,
-                    str(worker_script),
-                    "--input", input_pdf_path,
-                    "--output", str(temp_result_dir),
-                    "--whitelist-mode", "strict"
-                ],
+                worker_args,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 stdin=subprocess.DEVNULL,
-                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,  # Windows only
+                bufsize=0,
+                creationflags=creationflags,
+            )
+            
+            if use_job_port:
+                try:
+                    completion_port = _create_completion_port()
+                    hjob = create_limited_job_object(
+                        f"pdf_sanitizer_{request_id}",
+                        self.memory_limit_mb,
+                        self.cpu_time_limit_sec,
+                        completion_port=completion_port,
+                        completion_key=1
+                    )
+                    _assign_to_job(hjob, process)
+                    _resume_process(process.pid)
+                except Exception:
+                    process.kill()
+                    process.wait()
+                    raise
+            
+            # Drain both pipes on side threads so a chatty worker can never
+            # block on a full pipe, and only the stderr tail is retained.
+            stderr_tail = collections.deque(maxlen=STDERR_TAIL_LINES)
+            result_frame = []
+            stderr_thread = threading.Thread(
+                target=_drain_stderr, args=(process.stderr, stderr_tail), daemon=True
+            )
+            stdout_thread = threading.Thread(
+                target=_read_result_frame, args=(process.stdout, result_frame), daemon=True
             )
+            stderr_thread.start()
+            stdout_thread.start()
             
             try:
-                stdout, stderr = process.communicate(timeout=timeout_seconds)
-                
-                if process.returncode != 0:
-                    error_msg = stderr.decode('utf-8', errors='replace') if stderr else "Unknown error"
-                    logging.error(f"PDF parser process failed with code {process.returncode}: {error_msg}")
-                    raise Exception(f"PDF parser crashed: {error_msg}")
-                
-                # Read results from isolated temp directory
-                result_file = temp_result_dir / "result.json"
-                if result_file.exists():
-                    with open(result_file, 'r') as f:
-                        result = json.load(f)
-                    logging.info(f"Successfully parsed PDF: {result.get('status', 'unknown')}")
-                    return result
+                if use_job_port:
+                    if not _wait_for_job_exit(completion_port, timeout_seconds):
+                        raise subprocess.TimeoutExpired(worker_args, timeout_seconds)
+                    process.wait()
                 else:
-                    raise Exception("Parser produced no valid results")
-                    
+                    process.wait(timeout=timeout_seconds)
             except subprocess.TimeoutExpired:
                 process.kill()
-                logging.error(f"PDF parsing timeout after {timeout_seconds} seconds")
+                process.wait()
+                logging.error("PDF parsing timeout after %s seconds", timeout_seconds)
                 raise TimeoutError(f"PDF parsing exceeded {timeout_seconds}s timeout")
+            
+            stdout_thread.join()
+            stderr_thread.join()
+            
+            if process.returncode != 0:
+                error_msg = "\n".join(stderr_tail) or "Unknown error"
+                logging.error("PDF parser process failed with code %s: %s", process.returncode, error_msg)
+                raise Exception(f"PDF parser crashed: {error_msg}")
+            
+            if not result_frame:
+                raise Exception("Parser produced no valid results")
+            result = orjson.loads(result_frame[0])
+            logging.info("Successfully parsed PDF: %s", result.get('status', 'unknown'))
+            return result
                 
         finally:
-            # Cleanup: securely delete temp results
-            import shutil
+            # Closing the job handle kills anything left in it (KILL_ON_JOB_CLOSE)
+            if hjob is not None:
+                win32api.CloseHandle(hjob)
+            if completion_port is not None:
+                _close_handle(completion_port)
+            # Cleanup: remove this request's scratch file
             try:
-                shutil.rmtree(temp_result_dir, ignore_errors=True)
-                logging.debug(f"Cleaned up temporary directory: {temp_result_dir}")
-            except Exception as e:
-                logging.warning(f"Could not clean up temp directory {temp_result_dir}: {e}")
+                os.unlink(sanitized_pdf)
+                logging.debug("Cleaned up scratch file: %s", sanitized_pdf)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logging.warning("Could not clean up scratch file %s: %s", sanitized_pdf, e)
+
+    def parse_batch(self, paths: list, timeout_seconds: int = 300) -> list:
+        """
+        Parse several PDFs through one long-lived worker process, so
+        interpreter startup and the pikepdf import are paid once per batch
+        rather than once per file.
+
+        Each request is one JSON line on the worker's stdin; each answer is a
+        length-prefixed result frame on its stdout, as in parse_pdf_isolated.
+
+        Args:
+            paths (list): Paths of the input PDF files.
+            timeout_seconds (int): Maximum time to allow for each file (default: 300 seconds).
+
+        Returns:
+            list: One result dict per input path, in order. A file the worker
+                fails to sanitize yields its error result instead of raising.
+
+        Raises:
+            TimeoutError: If any single file exceeds the timeout.
+            Exception: If the worker exits before answering every request.
+        """
+        worker_script = Path(__file__).parent / "worker_pdf_parser.py"
+        if not worker_script.exists():
+            raise FileNotFoundError(f"Worker script not found at: {worker_script}")
+
+        batch_id = uuid.uuid4().hex
+        scratch_files = []
+        results = []
+        hjob = None
+
+        logging.info("Starting isolated batch parsing for %s PDFs", len(paths))
+        worker_args = [
+            sys.executable,
+            str(worker_script),
+            "--batch",
+            "--whitelist-mode", "strict"
+        ]
+        creationflags = subprocess.CREATE_NEW_PROCESS_GROUP  # Windows only
+        if win32job is not None:
+            # Resumed once it is in the job, as in parse_pdf_isolated
+            creationflags |= win32process.CREATE_SUSPENDED
+        process = subprocess.Popen(
+            worker_args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            stdin=subprocess.PIPE,
+            bufsize=0,
+            creationflags=creationflags,
+        )
+
+        try:
+            # The worker outlives each request, so the Job Object only
+            # enforces limits here; completion is signalled by result frames.
+            # If this fails, the worker is killed below before it has run.
+            if win32job is not None:
+                hjob = create_limited_job_object(
+                    f"pdf_sanitizer_{batch_id}",
+                    self.memory_limit_mb,
+                    self.cpu_time_limit_sec
+                )
+                _assign_to_job(hjob, process)
+                _resume_process(process.pid)
+
+            stderr_tail = collections.deque(maxlen=STDERR_TAIL_LINES)
+            stderr_thread = threading.Thread(
+                target=_drain_stderr, args=(process.stderr, stderr_tail), daemon=True
+            )
+            stderr_thread.start()
+
+            for index, input_pdf_path in enumerate(paths):
+                sanitized_pdf = self.scratch_dir / f"{batch_id}-{index}.pdf"
+                scratch_files.append(sanitized_pdf)
+                logging.info("Batch parsing: %s", input_pdf_path)
+
+                request = orjson.dumps({"input": str(input_pdf_path), "output": str(sanitized_pdf)})
+                try:
+                    process.stdin.write(request + b"\n")
+                    process.stdin.flush()
+                except OSError:
+                    pass  # Worker already exited; reported below as a missing frame
+
+                result_frame = []
+                reader = threading.Thread(
+                    target=_read_frame, args=(process.stdout, result_frame), daemon=True
+                )
+                reader.start()
+                reader.join(timeout_seconds)
+                if reader.is_alive():
+                    logging.error("PDF parsing timeout after %s seconds", timeout_seconds)
+                    raise TimeoutError(f"PDF parsing exceeded {timeout_seconds}s timeout")
+                if not result_frame:
+                    process.wait()
+                    stderr_thread.join()
+                    error_msg = "\n".join(stderr_tail) or "Unknown error"
+                    logging.error("PDF parser process failed with code %s: %s", process.returncode, error_msg)
+                    raise Exception(f"PDF parser crashed: {error_msg}")
+
+                result = orjson.loads(result_frame[0])
+                logging.info("Parsed PDF %s: %s", input_pdf_path, result.get('status', 'unknown'))
+                results.append(result)
+
+            # EOF on stdin tells the worker to exit
+            process.stdin.close()
+            process.wait(timeout=timeout_seconds)
+            stderr_thread.join()
+            return results
+
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            if hjob is not None:
+                win32api.CloseHandle(hjob)
+            for sanitized_pdf in scratch_files:
+                try:
+                    os.unlink(sanitized_pdf)
+                    logging.debug("Cleaned up scratch file: %s", sanitized_pdf)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logging.warning("Could not clean up scratch file %s: %s", sanitized_pdf, e)
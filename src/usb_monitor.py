@@ -4,15 +4,53 @@ import pythoncom
 import wmi
 import subprocess
 import winreg
-import json
+import orjson
 from datetime import datetime
 import socket
 import os
+import re
 import logging
+from src.usb_utils import READONLY_RE
+
+# Markers scanned in Win32_DeviceGuard output; both verdicts come from one pass
+_DEVICE_GUARD_RE = re.compile(r'SecurityServicesConfigured|0')
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+SOC_SERVER = "siem.domain.local"  # Configurable
+SOC_PORT = 514  # syslog
+
+# Pre-resolved SIEM address and reusable non-blocking UDP socket, so the
+# breach path never waits on DNS or socket setup before shutting down
+_soc_addr = None
+_soc_sock = None
+
+# icacls argv for enforce_usb_readonly_ntfs; only the drive slot changes per call
+_USERNAME = os.environ.get('USERNAME', '')
+_ICACLS_TEMPLATE = (
+    "icacls",
+    None,  # "<drive>:\\"
+    "/grant:r", f"{_USERNAME}:(R)",   # Read-only
+    "/deny:r", f"{_USERNAME}:(W)",    # Explicit write denial
+)
+# Avoid a console window flash when run from the GUI (Windows only)
+_CREATE_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+
+def _prepare_soc_channel():
+    """Resolve the SIEM address and create the alert socket once."""
+    global _soc_addr, _soc_sock
+    if _soc_sock is not None:
+        return
+    try:
+        _soc_addr = socket.getaddrinfo(SOC_SERVER, SOC_PORT, socket.AF_INET, socket.SOCK_DGRAM)[0][4]
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        _soc_sock = sock
+    except OSError as e:
+        logging.warning("Could not prepare SOC alert channel: %s", e)
+
 
 class IsolationStatus(Enum):
     HEALTHY = 1
@@ -34,6 +72,7 @@ class USBIsolationMonitor:
         
     def start_monitoring(self):
         """Start background monitor thread for WMI events."""
+        _prepare_soc_channel()
         self.monitor_thread = threading.Thread(
             target=self._monitor_loop,
             daemon=True  # Daemon thread will exit when main app exits
@@ -54,7 +93,7 @@ class USBIsolationMonitor:
                     self.wmi_watcher.stop()
                     logging.info("WMI watcher stopped successfully")
                 except Exception as e:
-                    logging.error(f"Error stopping WMI watcher: {e}")
+                    logging.error("Error stopping WMI watcher: %s", e)
             
             # Wait for monitor thread to finish with timeout
             if self.monitor_thread and self.monitor_thread.is_alive():
@@ -68,7 +107,7 @@ class USBIsolationMonitor:
             
             logging.info("USB isolation monitoring stopped and cleanup complete")
         except Exception as e:
-            logging.error(f"Error during stop_monitoring cleanup: {e}", exc_info=True)
+            logging.error("Error during stop_monitoring cleanup: %s", e, exc_info=True)
 
     def _monitor_loop(self):
         """
@@ -114,7 +153,7 @@ class USBIsolationMonitor:
             # Check via fsutil
             cmd = 'fsutil fsinfo volumeinfo D:\\'
             result = subprocess.check_output(cmd, shell=True, text=True)
-            is_readonly = 'Read-only' in result or 'ReadOnly' in result
+            is_readonly = bool(READONLY_RE.search(result))
             
             if not is_readonly:
                 print("[CRITICAL] USB mount is NOT read-only! Isolation compromised!")
@@ -169,7 +208,8 @@ class USBIsolationMonitor:
                 text=True
             )
             
-            if 'SecurityServicesConfigured' not in result or '0' in result:
+            found = {match.group(0) for match in _DEVICE_GUARD_RE.finditer(result)}
+            if 'SecurityServicesConfigured' not in found or '0' in found:
                 print("[CRITICAL] Device Guard / Code Integrity disabled! Isolation compromised!")
                 return False
             
@@ -250,26 +290,40 @@ class USBIsolationMonitor:
         
         log_file = r"C:\ProgramData\PDFSanitizer\compromise_alert.json"
         try:
-            with open(log_file, 'a') as f:
-                f.write(json.dumps(forensic_log) + "\n")
+            # One O_APPEND write per event so concurrent breach signals
+            # cannot interleave partial records
+            fd = os.open(
+                log_file,
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0),
+                0o600
+            )
+            try:
+                os.write(fd, orjson.dumps(forensic_log) + b"\n")
+            finally:
+                os.close(fd)
         except Exception as e:
             print(f"[ERROR] Could not write forensic log: {e}")
     
     def _alert_soc(self):
         """Send alert to SOC via syslog/SIEM integration"""
         
-        soc_server = "siem.domain.local"  # Configurable
-        soc_port = 514  # syslog
-        
         message = (
             f"[CRITICAL] PDF Sanitizer Security Breach: "
             f"USB isolation mechanism compromised on {socket.gethostname()}. "
             f"Immediate investigation required. Application terminated."
         )
         
+        # Prepared only at start_monitoring(). If the SIEM could not be
+        # resolved then, do not retry the lookup here: it would hold up
+        # the shutdown on the DNS timeout this channel exists to avoid.
+        if _soc_sock is None:
+            print("[WARNING] Could not notify SOC: alert channel unavailable")
+            return
+        
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.sendto(message.encode(), (soc_server, soc_port))
+            _soc_sock.sendto(message.encode(), _soc_addr)
+        except BlockingIOError:
+            pass  # Never delay shutdown on a congested socket
         except Exception as e:
             print(f"[WARNING] Could not notify SOC: {e}")
     
@@ -310,13 +364,9 @@ def enforce_usb_readonly_ntfs(usb_drive_letter: str) -> bool:
     Enforce read-only via NTFS permissions (cannot be overridden by apps)
     """
     try:
-        cmd = [
-            "icacls",
-            f"{usb_drive_letter}:\\",
-            "/grant:r", f"{os.environ['USERNAME']}:(R)",   # Read-only
-            "/deny:r", f"{os.environ['USERNAME']}:(W)",    # Explicit write denial
-        ]
-        subprocess.run(cmd, capture_output=True, check=True)
+        cmd = list(_ICACLS_TEMPLATE)
+        cmd[1] = f"{usb_drive_letter}:\\"
+        subprocess.run(cmd, capture_output=True, check=True, creationflags=_CREATE_NO_WINDOW)
         return True
     except Exception as e:
         return False
@@ -1,27 +1,42 @@
 from pathlib import Path
+from typing import BinaryIO
 import ctypes
+import os
+import re
 import subprocess
 
+# Single-pass scanner for the read-only marker in fsutil volumeinfo output
+READONLY_RE = re.compile(r'Read-only|ReadOnly')
+
 class SecurityError(Exception):
     pass
 
-def read_pdf_from_usb(usb_mount_path: str, filename: str) -> bytes:
+def validate_pdf_on_usb(usb_mount_path: str, filename: str) -> Path:
     """
-    SECURE: Reads ONLY PDF files from USB, prevents directory traversal
+    SECURE: Validates a PDF file on USB, prevents directory traversal
     - Validates .pdf extension only
-    - Prevents path traversal (../, absolute paths)
+    - Prevents path traversal (../, absolute paths, symlinks out of the mount)
     - Checks file size limits
     - Verifies PDF magic number before processing
+
+    Returns the validated path without reading the file body, so callers
+    can hand it straight to pikepdf instead of buffering up to 500 MB.
     """
     # 1. Extension validation
     if not filename.lower().endswith('.pdf'):
         raise ValueError("Only PDF files allowed")
     
-    # 2. Path traversal prevention
-    if '..' in filename or filename.startswith('/') or filename.startswith('\\'):
+    # 2. Path traversal prevention: the resolved file must stay under the mount
+    base = os.path.realpath(usb_mount_path)
+    full = os.path.realpath(os.path.join(usb_mount_path, filename))
+    try:
+        inside_mount = os.path.commonpath([base, full]) == base
+    except ValueError:  # Different drives on Windows
+        inside_mount = False
+    if not inside_mount:
         raise ValueError("Path traversal attempt blocked")
     
-    filepath = Path(usb_mount_path) / filename
+    filepath = Path(full)
     
     # 3. Verify mount is read-only
     if not is_mount_readonly(usb_mount_path):
@@ -38,7 +53,21 @@ def read_pdf_from_usb(usb_mount_path: str, filename: str) -> bytes:
     if file_size > 500 * 1024 * 1024:  # 500 MB max
         raise ValueError(f"PDF too large: {file_size} bytes")
     
-    return filepath.read_bytes()
+    return filepath
+
+def open_pdf_on_usb(usb_mount_path: str, filename: str) -> BinaryIO:
+    """
+    Validates a PDF on USB and returns an open binary handle to it.
+    The caller is responsible for closing the handle.
+    """
+    return open(validate_pdf_on_usb(usb_mount_path, filename), 'rb')
+
+def read_pdf_from_usb(usb_mount_path: str, filename: str) -> bytes:
+    """
+    Validates a PDF on USB and returns its full contents.
+    Prefer validate_pdf_on_usb() when the consumer accepts a path.
+    """
+    return validate_pdf_on_usb(usb_mount_path, filename).read_bytes()
 
 def is_mount_readonly(mount_path: str) -> bool:
     """Verify Windows mount is read-only via registry check"""
@@ -52,6 +81,6 @@ def is_mount_readonly(mount_path: str) -> bool:
         
         cmd = f'fsutil fsinfo volumeinfo {mount_path}'
         output = subprocess.check_output(cmd, shell=True, text=True)
-        return 'Read-only' in output or 'ReadOnly' in output
+        return bool(READONLY_RE.search(output))
     except:
         return False
\ No newline at end of file
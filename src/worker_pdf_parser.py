@@ -1,11 +1,12 @@
-import json
 import sys
-import os
 import logging
+import struct
 import traceback
 from pathlib import Path
 from decimal import Decimal
 
+import orjson
+
 # Setup logging to stderr so it appears in subprocess output
 logging.basicConfig(
     level=logging.DEBUG,
@@ -14,17 +15,90 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class DecimalEncoder(json.JSONEncoder):
-    """JSON encoder that handles Decimal objects and other non-serializable objects from pikepdf"""
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return float(obj)
-        # Handle other non-serializable objects by converting to string
-        # This prevents "Object is not JSON serializable" errors
+def _json_default(obj):
+    """orjson default hook that handles Decimal objects and other non-serializable objects from pikepdf"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    # Handle other non-serializable objects by converting to string
+    # This prevents "Object is not JSON serializable" errors
+    try:
+        return str(obj)
+    except Exception:
+        return repr(obj)
+
+# Result frame header: 4-byte big-endian payload length (must match sandboxing.py)
+_FRAME_HEADER = struct.Struct(">I")
+
+def _write_result(result_data: dict):
+    """
+    Serializes the result dict with orjson and writes it to stdout as a
+    single length-prefixed frame. Logging stays on stderr.
+    """
+    payload = orjson.dumps(result_data, default=_json_default)
+    sys.stdout.buffer.write(_FRAME_HEADER.pack(len(payload)) + payload)
+    sys.stdout.buffer.flush()
+
+def _sanitize(input_file: str, output_pdf: str) -> dict:
+    """Parses input_file, writes the sanitized PDF to output_pdf and returns the status result."""
+    from src.core_engine import PDFWhitelistParser, PDFReconstructor
+    
+    logger.info("Parsing PDF: %s", input_file)
+    parser = PDFWhitelistParser(input_file)
+    whitelisted_data = parser.parse()
+    logger.info("Extracted metadata from %s pages", len(whitelisted_data.get('pages', [])))
+    
+    # Get the original PDF for content extraction
+    original_pdf = parser.get_original_pdf()
+    
+    logger.info("Reconstructing sanitized PDF...")
+    reconstructor = PDFReconstructor(whitelisted_data, original_pdf)
+    reconstructor.build(output_pdf, keep_open=False)
+    original_pdf.close()
+    
+    logger.info("Sanitized PDF saved to: %s", output_pdf)
+    
+    # Status result; the page data stays in the worker, only its count
+    # is reported
+    return {
+        "status": "success",
+        "output_file": output_pdf,
+        "num_pages": len(whitelisted_data.get('pages', []))
+    }
+
+def _error_result(e: Exception) -> dict:
+    """Logs the failure and builds the error result sent back to the parent."""
+    logger.error("Error during sanitization: %s", e)
+    logger.error(traceback.format_exc())
+    return {
+        "status": "error",
+        "message": str(e),
+        "traceback": traceback.format_exc()
+    }
+
+def _serve_batch():
+    """
+    Batch mode: reads one JSON request per line from stdin, each with
+    "input" and "output" paths, and answers each with a result frame.
+    Exits on EOF. Module imports are paid once for the whole batch.
+    """
+    logger.info("Importing PDF modules...")
+    import src.core_engine  # noqa: F401
+    
+    while True:
+        line = sys.stdin.buffer.readline()
+        if not line:
+            break
+        if not line.strip():
+            continue
         try:
-            return str(obj)
-        except Exception:
-            return repr(obj)
+            request = orjson.loads(line)
+            logger.info("Input file: %s", request["input"])
+            logger.info("Output file: %s", request["output"])
+            result_data = _sanitize(request["input"], request["output"])
+        except Exception as e:
+            result_data = _error_result(e)
+        _write_result(result_data)
+    logger.info("Batch complete, worker exiting successfully")
 
 def main():
     """
@@ -38,73 +112,42 @@ def main():
     if str(project_root) not in sys.path:
         sys.path.insert(0, str(project_root))
     
-    logger.info(f"Project root: {project_root}")
-    logger.info(f"sys.path: {sys.path[:3]}")
+    logger.info("Project root: %s", project_root)
+    logger.info("sys.path: %s", sys.path[:3])
+    
+    if "--batch" in sys.argv:
+        _serve_batch()
+        return
     
     input_file = ""
-    output_dir = ""
     output_pdf = ""
     for i, arg in enumerate(sys.argv):
         if arg == "--input" and i + 1 < len(sys.argv):
             input_file = sys.argv[i+1]
         elif arg == "--output" and i + 1 < len(sys.argv):
-            output_dir = sys.argv[i+1]
+            output_pdf = sys.argv[i+1]
 
-    logger.info(f"Input file: {input_file}")
-    logger.info(f"Output dir: {output_dir}")
+    logger.info("Input file: %s", input_file)
+    logger.info("Output file: %s", output_pdf)
 
-    if not input_file or not output_dir:
-        logger.error("Usage: python worker_pdf_parser.py --input <path> --output <path>")
+    if not input_file or not output_pdf:
+        logger.error("Usage: python worker_pdf_parser.py --input <path> --output <sanitized.pdf>")
+        logger.error("       python worker_pdf_parser.py --batch")
         sys.exit(1)
 
-    # Generate output PDF path (sanitized)
-    input_path = Path(input_file)
-    output_pdf = os.path.join(output_dir, f"{input_path.stem}_sanitized.pdf")
-
     try:
         logger.info("Importing PDF modules...")
-        from src.core_engine import PDFWhitelistParser, PDFReconstructor
-        
-        logger.info(f"Parsing PDF: {input_file}")
-        parser = PDFWhitelistParser(input_file)
-        whitelisted_data = parser.parse()
-        logger.info(f"Extracted metadata from {len(whitelisted_data.get('pages', []))} pages")
-        
-        # Get the original PDF for content extraction
-        original_pdf = parser.get_original_pdf()
-        
-        logger.info(f"Reconstructing sanitized PDF...")
-        reconstructor = PDFReconstructor(whitelisted_data, original_pdf)
-        reconstructor.build(output_pdf)
-        
-        logger.info(f"Sanitized PDF saved to: {output_pdf}")
-        
-        # Write status result
-        result_data = {
-            "status": "success",
-            "output_file": output_pdf,
-            "pages": len(whitelisted_data.get('pages', []))
-        }
-        output_file = os.path.join(output_dir, "result.json")
-        logger.info(f"Writing result to: {output_file}")
-        with open(output_file, "w") as f:
-            json.dump(result_data, f, indent=2, cls=DecimalEncoder)
+        result_data = _sanitize(input_file, output_pdf)
+        logger.info("Writing result to stdout")
+        _write_result(result_data)
         logger.info("Sanitization complete, worker exiting successfully")
         
     except Exception as e:
-        logger.error(f"Error during sanitization: {e}")
-        logger.error(traceback.format_exc())
-        result_data = {
-            "status": "error",
-            "message": str(e),
-            "traceback": traceback.format_exc()
-        }
-        output_file = os.path.join(output_dir, "result.json")
+        result_data = _error_result(e)
         try:
-            with open(output_file, "w") as f:
-                json.dump(result_data, f, indent=2, cls=DecimalEncoder)
+            _write_result(result_data)
         except Exception as write_err:
-            logger.error(f"Failed to write error result: {write_err}")
+            logger.error("Failed to write error result: %s", write_err)
         sys.exit(1)
 
 if __name__ == "__main__":
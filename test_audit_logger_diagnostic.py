@@ -2,23 +2,19 @@
 """
 Diagnostic test for audit_logger to verify logs are being created.
 """
+import os
 import sys
 import logging
 from pathlib import Path
 
-# Add parent directory to path
-project_root = Path(__file__).parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
-# Configure comprehensive logging to see all messages
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s'
-)
+import orjson
 
 from src.audit_logger import AuditLogger
 
+# Dummy file contents, built once at import
+_ORIG_PAYLOAD = b"original content of a PDF file" * 100
+_SAN_PAYLOAD = b"sanitized content"
+
 def test_audit_logger():
     """Test basic audit logger functionality."""
     print("\n" + "="*80)
@@ -45,10 +41,8 @@ def test_audit_logger():
     sanitized_file = Path("diagnostic_sanitized.pdf")
     
     try:
-        with open(original_file, "wb") as f:
-            f.write(b"original content of a PDF file" * 100)
-        with open(sanitized_file, "wb") as f:
-            f.write(b"sanitized content")
+        original_file.write_bytes(_ORIG_PAYLOAD)
+        sanitized_file.write_bytes(_SAN_PAYLOAD)
         print(f"   [OK] Test files created")
         print(f"   - Original: {original_file} ({original_file.stat().st_size} bytes)")
         print(f"   - Sanitized: {sanitized_file} ({sanitized_file.stat().st_size} bytes)")
@@ -80,6 +74,7 @@ def test_audit_logger():
     
     try:
         logger.log_event(event_data)
+        logger.flush()
         print(f"   [OK] log_event() called successfully")
     except Exception as e:
         print(f"   [FAIL] Failed to call log_event: {e}", exc_info=True)
@@ -87,46 +82,42 @@ def test_audit_logger():
     
     # Verify logs were created
     print(f"\n4. Verifying log files were created")
-    json_files = list(log_dir.glob("*.json"))
-    txt_files = list(log_dir.glob("*.txt"))
+    json_files = [e for e in os.scandir(log_dir) if ".jsonl" in e.name]
     
     print(f"   - JSON files in {log_dir}: {len(json_files)}")
-    for f in json_files:
-        print(f"     - {f.name} ({f.stat().st_size} bytes)")
-    
-    print(f"   - TXT files in {log_dir}: {len(txt_files)}")
-    for f in txt_files:
-        print(f"     - {f.name} ({f.stat().st_size} bytes)")
+    for e in json_files:
+        print(f"     - {e.name} ({e.stat().st_size} bytes)")
     
-    if json_files and txt_files:
+    if json_files:
         print(f"\n   [OK] Log files created successfully!")
         
-        # Display content of latest files
-        latest_json = max(json_files, key=lambda f: f.stat().st_mtime)
-        latest_txt = max(txt_files, key=lambda f: f.stat().st_mtime)
+        # The stream is append-only, so show the record just written rather
+        # than the start of the file
+        latest_record = logger.recent_logs(1)[0]
         
-        print(f"\n5. Content of latest JSON log ({latest_json.name}):")
+        print(f"\n5. Record just written to {logger.json_log_path.name}:")
         print("   " + "-"*70)
-        with open(latest_json, 'r') as f:
-            content = f.read()
-            for line in content.split('\n')[:20]:  # Show first 20 lines
-                print(f"   {line}")
+        for line in orjson.dumps(latest_record, option=orjson.OPT_INDENT_2).decode().splitlines():
+            print(f"   {line}")
         
-        print(f"\n6. Content of latest TXT log ({latest_txt.name}):")
+        print(f"\n6. TXT report rendered from the latest JSON record:")
         print("   " + "-"*70)
-        with open(latest_txt, 'r') as f:
-            content = f.read()
-            for line in content.split('\n'):
-                print(f"   {line}")
+        content = logger.render_txt(latest_record)
+        for line in content.splitlines():
+            print(f"   {line}")
         
         return True
     else:
         print(f"   [FAIL] Log files NOT created!")
         print(f"   - Expected JSON files but found {len(json_files)}")
-        print(f"   - Expected TXT files but found {len(txt_files)}")
         return False
 
 if __name__ == '__main__':
+    # Configure comprehensive logging to see all messages
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format='[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s'
+    )
     success = test_audit_logger()
     
     print("\n" + "="*80)
@@ -5,40 +5,62 @@ from pathlib import Path
 from src.config_manager import ConfigManager
 from src.audit_logger import AuditLogger
 import shutil
+import threading
+import uuid
 import logging
-import json
+import orjson
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Dummy file contents, built once at import
+_ORIG_PAYLOAD = b"original content"
+_SAN_PAYLOAD = b"sanitized content"
+
 def test_audit_logging():
     """Test that audit logs are created in the ./logs folder"""
     
     # Clean up old logs
     logs_dir = Path("logs")
+    cleanup = None
     if logs_dir.exists():
-        logger.info(f"Cleaning up old logs directory: {logs_dir}")
-        shutil.rmtree(logs_dir)
+        logger.info("Cleaning up old logs directory: %s", logs_dir)
+        # Rename is atomic and frees the path at once; delete in the
+        # background while the test runs, and wait for it before returning
+        old_logs = logs_dir.with_name(f"{logs_dir.name}.old-{uuid.uuid4().hex}")
+        logs_dir.rename(old_logs)
+        cleanup = threading.Thread(
+            target=shutil.rmtree, args=(old_logs,), kwargs={"ignore_errors": True}
+        )
+        cleanup.start()
     
+    try:
+        _check_audit_logging()
+    finally:
+        if cleanup is not None:
+            cleanup.join()
+    return True
+
+def _check_audit_logging():
+    """Body of test_audit_logging, run once the old logs are out of the way."""
     # Create ConfigManager and get log directory
     config = ConfigManager()
     log_dir = config.get("log_directory")
-    logger.info(f"Log directory from config: {log_dir}")
+    logger.info("Log directory from config: %s", log_dir)
     
     # Create AuditLogger
-    logger.info(f"Creating AuditLogger with directory: {log_dir}")
+    logger.info("Creating AuditLogger with directory: %s", log_dir)
     audit_logger = AuditLogger(log_directory=log_dir)
     
     # Verify directory was created
     log_path = Path(log_dir)
     assert log_path.exists(), f"Log directory not created: {log_path}"
-    logger.info(f"✓ Log directory created: {log_path}")
+    logger.info("✓ Log directory created: %s", log_path)
     
     # Create dummy files for testing
     test_orig = Path("test_original.pdf")
     test_sanitized = Path("test_sanitized.pdf")
-    test_orig.write_bytes(b"original content")
-    test_sanitized.write_bytes(b"sanitized content")
+    test_orig.write_bytes(_ORIG_PAYLOAD)
+    test_sanitized.write_bytes(_SAN_PAYLOAD)
     
     # Log a test event
     test_event = {
@@ -63,38 +85,33 @@ def test_audit_logging():
     
     logger.info("Logging test event...")
     audit_logger.log_event(test_event)
+    audit_logger.flush()
     
     # Verify logs were created
-    log_files = list(log_path.glob("*.json"))
-    assert len(log_files) > 0, "No JSON log files created"
-    logger.info(f"✓ JSON log created: {log_files[0].name}")
-    
-    txt_files = list(log_path.glob("*.txt"))
-    assert len(txt_files) > 0, "No TXT log files created"
-    logger.info(f"✓ TXT log created: {txt_files[0].name}")
+    json_log = audit_logger.json_log_path
+    assert json_log.exists(), "No JSON audit log created"
+    logger.info("✓ JSON log created: %s", json_log.name)
     
-    # Read and verify JSON content
-    with open(log_files[0], 'r') as f:
-        json_content = json.load(f)
-    assert json_content.get("status") == "SUCCESS", "JSON log content is invalid"
-    logger.info(f"✓ JSON log content verified")
+    # Read and verify JSON content (one record per line); the records are
+    # only counted, and just the newest one is decoded to probe its status
+    with open(json_log, 'rb') as f:
+        json_lines = [line for line in f if line.strip()]
+    assert len(json_lines) == 1, f"Expected 1 JSON record, found {len(json_lines)}"
+    json_record = orjson.loads(json_lines[-1])
+    assert json_record.get("status") == "SUCCESS", "JSON log content is invalid"
+    logger.info("✓ JSON log content verified")
     
-    # Read and verify TXT content
-    with open(txt_files[0], 'r', encoding='utf-8') as f:
-        txt_content = f.read()
-    assert "PDF SANITIZATION REPORT" in txt_content, "TXT log content is invalid"
-    logger.info(f"✓ TXT log content verified")
+    # Verify the TXT report rendered from the JSON record
+    txt_content = audit_logger.render_txt(json_record)
+    assert "PDF SANITIZATION REPORT" in txt_content, "TXT report content is invalid"
+    logger.info("✓ TXT report rendering verified")
     
     # Verify HistoryViewer can read the logs (file-level, not Qt-level)
     logger.info("Testing HistoryViewer log reading capability...")
-    log_json_files = sorted(
-        audit_logger.log_dir.glob("*.json"),
-        key=lambda f: f.stat().st_mtime,
-        reverse=True
-    )
+    history_events = list(audit_logger.iter_events())
     
-    assert len(log_json_files) > 0, "HistoryViewer would not find any logs"
-    logger.info(f"✓ HistoryViewer would find {len(log_json_files)} log file(s)")
+    assert len(history_events) > 0, "HistoryViewer would not find any logs"
+    logger.info("✓ HistoryViewer would find %s event(s)", len(history_events))
     
     # Clean up test files
     test_orig.unlink()
@@ -103,14 +120,14 @@ def test_audit_logging():
     logger.info("\n┌─────────────────────────────────────────┐")
     logger.info("│ ✓ All audit logging tests passed!      │")
     logger.info("│ • Logs created in ./logs folder         │")
-    logger.info("│ • Both JSON and TXT formats created     │")
+    logger.info("│ • JSON log created, TXT report rendered │")
     logger.info("│ • History viewer can read logs          │")
     logger.info("└─────────────────────────────────────────┘")
-    return True
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     try:
         test_audit_logging()
     except Exception as e:
-        logger.error(f"Test failed: {e}", exc_info=True)
+        logger.error("Test failed: %s", e, exc_info=True)
         exit(1)
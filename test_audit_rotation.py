@@ -0,0 +1,127 @@
+"""
+Tests for the audit.jsonl stream: record serialization, rotation, segment
+compression, batch retry and recovery from a record torn by a crash.
+"""
+import pytest
+
+import src.audit_logger as audit_logger
+from src.audit_logger import AuditLogger, JSON_LOG_NAME
+
+
+def _operators(logger):
+    return [event["operator"] for event in logger.iter_events()]
+
+
+def test_records_orjson_rejects_are_still_written(tmp_path):
+    logger = AuditLogger(str(tmp_path))
+    try:
+        logger.log_event({"operator": "int-keys", "pages": {1: "first"}})
+        logger.log_event({"operator": "big-int", "size": 1 << 70})
+        unserializable = {"operator": "cycle"}
+        unserializable["self"] = unserializable
+        logger.log_event(unserializable)
+        logger.flush()
+        # The record that could not be written is not reported as written
+        assert [event["operator"] for event in logger.recent_logs()] == ["int-keys", "big-int"]
+    finally:
+        logger.close()
+
+    events = list(logger.iter_events())
+    assert len(events) == 2
+    assert events[0]["pages"] == {"1": "first"}
+    # Written exactly, even though orjson reads it back as a float
+    assert str(1 << 70).encode() in (tmp_path / JSON_LOG_NAME).read_bytes()
+
+
+def test_rotation_starts_new_segment(tmp_path, monkeypatch):
+    monkeypatch.setattr(audit_logger, "zstandard", None)
+    logger = AuditLogger(str(tmp_path), rotate_bytes=1)
+    try:
+        for name in ("first", "second"):
+            logger.log_event({"operator": name})
+            logger.flush()
+    finally:
+        logger.close()
+
+    assert len(logger.log_segments()) == 3  # two rotated segments + the fresh audit.jsonl
+    assert _operators(logger) == ["first", "second"]
+
+
+def test_failed_rotation_keeps_logging(tmp_path, monkeypatch):
+    monkeypatch.setattr(audit_logger, "zstandard", None)
+
+    def refuse_rename(src, dst):
+        raise PermissionError("audit.jsonl is open elsewhere")
+
+    monkeypatch.setattr(audit_logger.os, "replace", refuse_rename)
+    logger = AuditLogger(str(tmp_path), rotate_bytes=1)
+    try:
+        logger.log_event({"operator": "before"})
+        logger.flush()
+        logger.log_event({"operator": "after"})
+        logger.flush()
+        assert logger.recent_logs()[-1]["operator"] == "after"
+    finally:
+        logger.close()
+
+    assert logger.log_segments() == [tmp_path / JSON_LOG_NAME]
+    assert _operators(logger) == ["before", "after"]
+
+
+def test_failed_batch_is_retried(tmp_path, monkeypatch):
+    monkeypatch.setattr(audit_logger, "WRITE_RETRY_SECONDS", 0.01)
+    write_batch = AuditLogger._write_batch
+    calls = []
+
+    def fail_once(self, batch):
+        calls.append(len(batch))
+        if len(calls) == 1:
+            raise OSError("disk full")
+        write_batch(self, batch)
+
+    monkeypatch.setattr(AuditLogger, "_write_batch", fail_once)
+    logger = AuditLogger(str(tmp_path))
+    try:
+        logger.log_event({"operator": "retried"})
+        logger.flush()
+    finally:
+        # close() hands any batch still held for retry to one last write
+        logger.close()
+
+    assert len(calls) >= 2
+    assert _operators(logger) == ["retried"]
+
+
+def test_rotated_segment_is_compressed(tmp_path):
+    pytest.importorskip("zstandard")
+    logger = AuditLogger(str(tmp_path), rotate_bytes=1)
+    try:
+        logger.log_event({"operator": "compressed"})
+        logger.flush()
+    finally:
+        # close() waits for the compressor threads
+        logger.close()
+
+    segments = logger.log_segments()
+    assert segments[0].name.endswith(".jsonl.zst")
+    assert _operators(logger) == ["compressed"]
+
+
+def test_torn_record_is_skipped(tmp_path):
+    logger = AuditLogger(str(tmp_path))
+    logger.log_event({"operator": "intact"})
+    logger.close()
+    # A writer killed mid-record leaves a truncated trailing line
+    with open(tmp_path / JSON_LOG_NAME, "ab") as f:
+        f.write(b'{"event_id": "STZ-torn", "oper')
+
+    logger = AuditLogger(str(tmp_path))
+    try:
+        logger.log_event({"operator": "next"})
+        logger.flush()
+        events, _ = logger.events_since(0)
+        assert [event["operator"] for event in events] == ["next"]
+    finally:
+        logger.close()
+
+    assert _operators(logger) == ["intact", "next"]
@@ -3,106 +3,113 @@
 Debug script to test PDF sanitization and catch crashes.
 """
 
+import argparse
+import functools
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import logging
-import traceback
 
-# Add project root to path
-project_root = Path(__file__).parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def test_sanitize_pdf(pdf_path):
-    """Test sanitizing a specific PDF and catch any errors."""
+def _configure_logging():
+    """Script-mode logging; under pytest the root handler comes from conftest."""
+    logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+
+def test_sanitize_pdf(sample_pdf, pipeline, verify=False):
+    """
+    Test sanitizing a specific PDF and catch any errors.
+    With verify=True the saved output is re-opened from disk and checked.
+    Failures are raised as AssertionError; unexpected errors propagate.
+    """
+    pdf_path = str(sample_pdf)
     print(f"\n{'='*70}")
     print(f"Testing PDF: {pdf_path}")
     print(f"{'='*70}\n")
     
-    if not Path(pdf_path).exists():
-        print(f"✗ File not found: {pdf_path}")
-        return False
+    # One stat call both checks existence and gives the size
+    p = Path(pdf_path)
+    try:
+        st = p.stat()
+    except FileNotFoundError:
+        raise AssertionError(f"File not found: {pdf_path}") from None
+    
+    print("[1] Checking file...")
+    print(f"    ✓ File size: {st.st_size} bytes")
+    
+    print("\n[2] Initializing components...")
+    import pikepdf
+    from src.core_engine import PDFReconstructor
+    from testutils import cached_parse
+    
+    parser = pipeline["parser"]
+    print(f"    ✓ Components initialized")
+    
+    print("\n[3] Parsing PDF...")
+    result = parser.parse_pdf_isolated(pdf_path)
+    assert result.get("status") == "success", \
+        f"Parsing failed: {result.get('message', 'Unknown error')}"
+    print(f"    ✓ Parsing successful")
+    print(f"      - Pages: {result['num_pages']}")
+    
+    # The sandbox result only carries the page count, so rebuild from a
+    # local whitelist parse over the open original
+    print("\n[4] Reconstructing PDF...")
+    output_path = p.with_name(f"{p.stem}_test_sanitized.pdf")
+    with pikepdf.Pdf.open(pdf_path) as original_pdf:
+        reconstructor = PDFReconstructor(cached_parse(pdf_path, original_pdf), original_pdf)
+        reconstructor.build(str(output_path), keep_open=False)
+    print(f"    ✓ Reconstruction successful")
+    print(f"      - Output: {output_path}")
     
     try:
-        print("[1] Checking file...")
-        file_size = Path(pdf_path).stat().st_size
-        print(f"    ✓ File size: {file_size} bytes")
-        
-        print("\n[2] Initializing components...")
-        from src.sandboxing import SandboxedPDFParser
-        from src.core_engine import PDFReconstructor
-        from src.audit_logger import AuditLogger
-        from src.config_manager import ConfigManager
-        
-        config = ConfigManager()
-        parser = SandboxedPDFParser()
-        audit_logger = AuditLogger(log_directory=config.get("log_directory"))
-        print(f"    ✓ Components initialized")
-        
-        print("\n[3] Parsing PDF...")
-        result = parser.parse_pdf_isolated(pdf_path)
-        if result.get("status") != "success":
-            error_msg = result.get("message", "Unknown error")
-            print(f"    ✗ Parsing failed: {error_msg}")
-            return False
-        print(f"    ✓ Parsing successful")
-        print(f"      - Pages: {len(result.get('pages', []))}")
-        
-        print("\n[4] Reconstructing PDF...")
-        try:
-            output_path = Path(pdf_path).parent / f"{Path(pdf_path).stem}_test_sanitized.pdf"
-            reconstructor = PDFReconstructor(result)
-            reconstructor.build(str(output_path))
-            print(f"    ✓ Reconstruction successful")
-            print(f"      - Output: {output_path}")
-            
-            if output_path.exists():
-                output_size = output_path.stat().st_size
-                print(f"      - Output size: {output_size} bytes")
-            else:
-                print(f"    ✗ Output file not created!")
-                return False
-                
-        except Exception as e:
-            print(f"    ✗ Reconstruction error: {e}")
-            print(f"\nFull traceback:")
-            traceback.print_exc()
-            return False
-        
+        output_size = output_path.stat().st_size
+    except FileNotFoundError:
+        raise AssertionError("Output file not created!") from None
+    print(f"      - Output size: {output_size} bytes")
+    
+    if verify:
         print("\n[5] Verifying output...")
-        try:
-            from pikepdf import Pdf
-            pdf = Pdf.open(str(output_path))
-            print(f"    ✓ Output PDF opened successfully")
+        with pikepdf.Pdf.open(str(output_path)) as pdf:
+            print(f"    ✓ Output PDF re-opened successfully")
             print(f"      - Pages: {len(pdf.pages)}")
-            pdf.close()
-        except Exception as e:
-            print(f"    ✗ Output verification failed: {e}")
-            return False
-        
-        print("\n✅ TEST PASSED\n")
+    else:
+        print("\n[5] Skipping output verification (use --verify)")
+    
+    print("\n✅ TEST PASSED\n")
+
+def _run(pdf_path, verify=False) -> bool:
+    """Process-pool entry point: each worker process builds its own pipeline once."""
+    _configure_logging()
+    from testutils import build_pipeline
+    try:
+        test_sanitize_pdf(pdf_path, build_pipeline(), verify=verify)
         return True
-        
     except Exception as e:
-        print(f"\n✗ UNEXPECTED ERROR: {e}")
-        print(f"\nFull traceback:")
-        traceback.print_exc()
+        print(f"\n✗ {e}")
+        logger.exception("Error while testing %s", pdf_path)
         return False
 
 if __name__ == '__main__':
-    # Test with test_sample.pdf first
-    print("\nTesting with test_sample.pdf...")
-    test_sanitize_pdf("test_sample.pdf")
+    _configure_logging()
+    from testutils import FIXTURE_PDF
     
-    # Ask user for another file to test
-    print("\n" + "="*70)
-    print("Enter another PDF file path to test (or press Enter to skip):")
-    user_pdf = input().strip()
+    arg_parser = argparse.ArgumentParser(description="Sanitize PDFs and report any crashes.")
+    arg_parser.add_argument("pdfs", nargs="*", help="PDF files to test (default: test_sample.pdf)")
+    arg_parser.add_argument("--verify", action="store_true",
+                            help="re-open each sanitized PDF from disk to verify it")
+    args = arg_parser.parse_args()
+    pdf_paths = args.pdfs or [str(FIXTURE_PDF)]
     
-    if user_pdf and Path(user_pdf).exists():
-        test_sanitize_pdf(user_pdf)
-    elif user_pdf:
-        print(f"File not found: {user_pdf}")
+    # Each PDF is independent; parse + reconstruct run in parallel processes
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(functools.partial(_run, verify=args.verify), pdf_paths))
+    
+    print("\n" + "="*70)
+    print("SUMMARY")
+    print("="*70)
+    for pdf_path, ok in zip(pdf_paths, results):
+        print(f"  {'✓ PASS' if ok else '✗ FAIL'}: {pdf_path}")
+    print(f"\n{sum(results)}/{len(results)} passed")
+    sys.exit(0 if all(results) else 1)
@@ -6,102 +6,85 @@ Tests parsing, reconstruction, and audit logging.
 
 import sys
 import logging
-import json
 from pathlib import Path
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def test_full_pipeline():
+def test_full_pipeline(sample_pdf, pipeline):
     """Test the complete sanitization pipeline."""
     logger.info("=" * 70)
     logger.info("END-TO-END PDF SANITIZATION PIPELINE TEST")
     logger.info("=" * 70)
     
     # Setup
-    input_pdf = Path("test_sample.pdf")
-    output_pdf = Path("test_sample_sanitized.pdf")
-    log_dir = Path("logs")
+    input_pdf = Path(sample_pdf)
+    output_pdf = input_pdf.with_name(f"{input_pdf.stem}_sanitized.pdf")
     
-    if not input_pdf.exists():
-        logger.error(f"Test PDF not found: {input_pdf}")
-        return False
+    assert input_pdf.exists(), f"Test PDF not found: {input_pdf}"
     
-    try:
-        # Step 1: Initialize components
-        logger.info("\n[1] Initializing components...")
-        from src.config_manager import ConfigManager
-        from src.audit_logger import AuditLogger
-        from src.sandboxing import SandboxedPDFParser
-        from src.queue_manager import QueueManager
-        
-        config = ConfigManager()
-        audit_logger = AuditLogger(log_directory=str(log_dir))
-        parser = SandboxedPDFParser()
-        queue_mgr = QueueManager(parser, audit_logger)
-        logger.info("    ✓ Components initialized")
-        
-        # Step 2: Add file to queue
-        logger.info("\n[2] Adding PDF to queue...")
-        queue_mgr.add_file_to_queue(str(input_pdf))
-        logger.info(f"    ✓ Queue size: {len(queue_mgr.queue)}")
-        
-        # Step 3: Process the queue
-        logger.info("\n[3] Processing queue...")
-        queue_mgr.process_next_in_queue()
-        logger.info(f"    ✓ Queue size after processing: {len(queue_mgr.queue)}")
-        
-        # Step 4: Verify output file
-        logger.info("\n[4] Verifying output file...")
-        if not output_pdf.exists():
-            logger.error(f"    ✗ Sanitized PDF not created: {output_pdf}")
-            return False
-        logger.info(f"    ✓ Sanitized PDF created: {output_pdf}")
-        logger.info(f"    ✓ File size: {output_pdf.stat().st_size} bytes")
-        
-        # Step 5: Check audit logs
-        logger.info("\n[5] Checking audit logs...")
-        log_files = list(log_dir.glob("*.json"))
-        if not log_files:
-            logger.error("    ✗ No audit logs found")
-            return False
-        
-        latest_log = max(log_files, key=lambda p: p.stat().st_mtime)
-        logger.info(f"    ✓ Found {len(log_files)} audit log files")
-        logger.info(f"    ✓ Latest log: {latest_log.name}")
-        
-        # Read the log
-        with open(latest_log, 'r') as f:
-            log_data = json.load(f)
-        logger.info(f"    ✓ Log status: {log_data.get('status')}")
-        
-        # Step 6: Check TXT logs
-        logger.info("\n[6] Checking text audit logs...")
-        txt_files = list(log_dir.glob("*.txt"))
-        if not txt_files:
-            logger.error("    ✗ No text audit logs found")
-            return False
-        
-        latest_txt = max(txt_files, key=lambda p: p.stat().st_mtime)
-        logger.info(f"    ✓ Found {len(txt_files)} text audit logs")
-        logger.info(f"    ✓ Latest TXT log: {latest_txt.name}")
-        
-        logger.info("\n" + "=" * 70)
-        logger.info("✓ END-TO-END TEST PASSED")
-        logger.info("=" * 70)
-        logger.info("\nSummary:")
-        logger.info(f"  - Input PDF: {input_pdf} ({input_pdf.stat().st_size} bytes)")
-        logger.info(f"  - Output PDF: {output_pdf} ({output_pdf.stat().st_size} bytes)")
-        logger.info(f"  - Audit logs (JSON): {len(log_files)} files")
-        logger.info(f"  - Audit logs (TXT): {len(txt_files)} files")
-        logger.info("=" * 70)
-        
-        return True
-        
-    except Exception as e:
-        logger.error(f"Test failed with exception: {e}", exc_info=True)
-        return False
+    # Step 1: Initialize components
+    logger.info("\n[1] Initializing components...")
+    from src.queue_manager import QueueManager
+    
+    audit_logger = pipeline["audit"]
+    parser = pipeline["parser"]
+    queue_mgr = QueueManager(parser, audit_logger)
+    logger.info("    ✓ Components initialized")
+    
+    # Step 2: Add file to queue
+    logger.info("\n[2] Adding PDF to queue...")
+    queue_mgr.add_file_to_queue(str(input_pdf))
+    logger.info("    ✓ Queue size: %s", len(queue_mgr.queue))
+    
+    # Step 3: Process the queue
+    logger.info("\n[3] Processing queue...")
+    # Drain events other tests left queued on the shared logger so they
+    # are not counted as this run's
+    audit_logger.flush()
+    with open(audit_logger.json_log_path, 'rb') as f:
+        lines_before = sum(1 for _ in f)
+    queue_mgr.process_next_in_queue()
+    logger.info("    ✓ Queue size after processing: %s", len(queue_mgr.queue))
+    
+    # Step 4: Verify output file
+    logger.info("\n[4] Verifying output file...")
+    assert output_pdf.exists(), f"Sanitized PDF not created: {output_pdf}"
+    logger.info("    ✓ Sanitized PDF created: %s", output_pdf)
+    logger.info("    ✓ File size: %s bytes", output_pdf.stat().st_size)
+    
+    # Step 5: Check audit logs
+    logger.info("\n[5] Checking audit logs...")
+    audit_logger.flush()
+    assert audit_logger.json_log_path.exists(), "No audit logs found"
+    
+    # The run's events are appended as lines of the single JSONL stream
+    with open(audit_logger.json_log_path, 'rb') as f:
+        new_lines = sum(1 for _ in f) - lines_before
+    assert new_lines == 1, f"Expected 1 new audit record, found {new_lines}"
+    
+    log_records = audit_logger.recent_logs()
+    log_data = log_records[-1]
+    logger.info("    ✓ Found %s new audit record", new_lines)
+    logger.info("    ✓ Latest record: %s", log_data.get('event_id'))
+    logger.info("    ✓ Log status: %s", log_data.get('status'))
+    
+    logger.info("\n" + "=" * 70)
+    logger.info("✓ END-TO-END TEST PASSED")
+    logger.info("=" * 70)
+    logger.info("\nSummary:")
+    logger.info("  - Input PDF: %s (%s bytes)", input_pdf, input_pdf.stat().st_size)
+    logger.info("  - Output PDF: %s (%s bytes)", output_pdf, output_pdf.stat().st_size)
+    logger.info("  - Audit records (JSON): %s", len(log_records))
+    logger.info("  - Audit log: %s", audit_logger.json_log_path)
+    logger.info("=" * 70)
 
 if __name__ == "__main__":
-    success = test_full_pipeline()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    from testutils import FIXTURE_PDF, build_pipeline
+    try:
+        test_full_pipeline(FIXTURE_PDF, build_pipeline())
+        success = True
+    except Exception as e:
+        logger.error("Test failed: %s", e, exc_info=True)
+        success = False
     sys.exit(0 if success else 1)
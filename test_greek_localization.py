@@ -4,19 +4,21 @@ Test script to verify Greek language support in the PDF Sanitizer.
 This tests the localization module and verifies Greek translations are available.
 """
 
+import io
 import sys
-from pathlib import Path
-
-# Add parent directory to path
-project_root = Path(__file__).parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from src.localization import (
     Localization, get_localization, set_language, t,
-    ENGLISH, GREEK, SUPPORTED_LANGUAGES
+    ENGLISH, GREEK, SUPPORTED_LANGUAGES, NO_TRANSLATION_KEYS
 )
 
+# Shared read-only instances; translations are memoized per language, so
+# reusing them lets lookups hit the cache across tests
+LOC_EN = Localization(ENGLISH)
+LOC_GR = Localization(GREEK)
+
 def test_supported_languages():
     """Test that English and Greek are supported."""
     print("Testing supported languages... ", end="", flush=True)
@@ -63,7 +65,7 @@ def test_greek_localization():
         result = loc.t(key)
         assert len(result) > 0, f"Greek translation for {key} is empty"
         # Verify it's different from English
-        english_result = Localization(ENGLISH).t(key)
+        english_result = LOC_EN.t(key)
         assert result != english_result, f"Greek and English translations are identical for {key}"
     print("[PASS]")
 
@@ -146,28 +148,50 @@ def test_greek_audit_translations():
 def test_all_keys_coverage():
     """Test that all translation keys have both English and Greek translations."""
     print("Testing translation key coverage... ", end="", flush=True)
-    loc_en = Localization(ENGLISH)
-    loc_gr = Localization(GREEK)
+    loc_en = LOC_EN
+    loc_gr = LOC_GR
     
     keys = loc_en.get_all_keys()
     assert len(keys) >= 35, f"Should have at least 35 translation keys, got {len(keys)}"
     
-    # Keys that don't need translation (units, symbols, etc.)
-    no_translation_keys = {'settings_memory_suffix', 'settings_timeout_suffix', 'dialog_pdf_filter'}
-    
-    for key in keys:
-        en_text = loc_en.t(key)
-        gr_text = loc_gr.t(key)
-        
-        # Both should have content
-        assert len(en_text) > 0, f"English translation for {key} is empty"
-        assert len(gr_text) > 0, f"Greek translation for {key} is empty"
-        
-        # They should be different (except for keys that don't need translation)
-        if key not in no_translation_keys:
-            assert en_text != gr_text, f"English and Greek are the same for {key}"
+    en_vals = [loc_en.t(k) for k in keys]
+    gr_vals = [loc_gr.t(k) for k in keys]
+    
+    # Both should have content, and they should differ (except for keys
+    # that don't need translation). Collect every offender so one failure
+    # reports them all.
+    empty_en = {k for k, v in zip(keys, en_vals) if not v}
+    empty_gr = {k for k, v in zip(keys, gr_vals) if not v}
+    same = {k for k, e, g in zip(keys, en_vals, gr_vals) if e == g} - NO_TRANSLATION_KEYS
+    assert not empty_en and not empty_gr and not same, \
+        f"empty_en={empty_en}, empty_gr={empty_gr}, same={same}"
     print("[PASS]")
 
+class _ThreadOutput(io.TextIOBase):
+    """Stand-in for sys.stdout that sends each thread's prints to its own buffer."""
+    
+    def __init__(self, fallback):
+        self._local = threading.local()
+        self._fallback = fallback
+    
+    def write(self, text):
+        return getattr(self._local, "buffer", self._fallback).write(text)
+    
+    def capture(self, test_func):
+        """Runs test_func on this thread; returns (output, failure or None)."""
+        self._local.buffer = io.StringIO()
+        try:
+            test_func()
+            failure = None
+        except AssertionError as e:
+            failure = f"[FAIL] - {str(e)}"
+        except Exception as e:
+            failure = f"[ERROR] - {str(e)}"
+        finally:
+            output = self._local.buffer.getvalue()
+            del self._local.buffer
+        return output, failure
+
 def main():
     """Run all tests."""
     print("=" * 70)
@@ -190,15 +214,23 @@ def main():
     passed = 0
     failed = 0
     
-    for test_name, test_func in tests:
-        try:
-            test_func()
+    # The tests are independent read-only lookups, so run them concurrently;
+    # each one's output is buffered and printed below in the original order
+    original_stdout = sys.stdout
+    thread_output = _ThreadOutput(original_stdout)
+    sys.stdout = thread_output
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            results = list(executor.map(thread_output.capture, [func for _, func in tests]))
+    finally:
+        sys.stdout = original_stdout
+    
+    for output, failure in results:
+        print(output, end="")
+        if failure is None:
             passed += 1
-        except AssertionError as e:
-            print(f"[FAIL] - {str(e)}")
-            failed += 1
-        except Exception as e:
-            print(f"[ERROR] - {str(e)}")
+        else:
+            print(failure)
             failed += 1
     
     print()
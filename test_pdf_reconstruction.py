@@ -4,24 +4,22 @@ Test script to debug PDF reconstruction issues.
 Tests with multiple PDFs to identify edge cases.
 """
 
-import sys
 from pathlib import Path
-
-# Add project root to path
-project_root = Path(__file__).parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+import tempfile
 
 import logging
+import traceback
 from src.sandboxing import SandboxedPDFParser
-from src.core_engine import PDFReconstructor
+from src.core_engine import PDFReconstructor, PDFWhitelistParser
 from pikepdf import Pdf
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def test_pdf_reconstruction(pdf_path):
-    """Test PDF reconstruction for a given PDF file."""
+def test_pdf_reconstruction(pdf_path, result=None):
+    """
+    Test PDF reconstruction for a given PDF file. Pass result to reuse a
+    sandbox parse already done for this file (e.g. by parse_batch).
+    """
     print(f"\n{'='*70}")
     print(f"Testing: {pdf_path}")
     print(f"{'='*70}")
@@ -50,71 +48,87 @@ def test_pdf_reconstruction(pdf_path):
     # Parse PDF
     print("\n[2] Parsing PDF...")
     try:
-        parser = SandboxedPDFParser()
-        result = parser.parse_pdf_isolated(pdf_path)
+        if result is None:
+            parser = SandboxedPDFParser()
+            result = parser.parse_pdf_isolated(pdf_path)
+        if result.get('status') == 'error':
+            raise Exception(result.get('message'))
+        # The sandbox result is a status dict: the page data stays in the
+        # worker and only its count comes back
         print(f"   ✓ PDF parsed successfully")
-        print(f"   - Pages in result: {len(result.get('pages', []))}")
-        if result.get('pages'):
-            first_page = result['pages'][0]
-            print(f"   - First page mediabox: {first_page.get('mediabox')}")
-            print(f"   - First page has contents: {len(first_page.get('contents', [])) > 0}")
+        print(f"   - Pages in result: {result['num_pages']}")
     except Exception as e:
         print(f"   ✗ Error parsing PDF: {e}")
-        import traceback
         traceback.print_exc()
         return False
     
-    # Reconstruct PDF
-    print("\n[3] Reconstructing PDF...")
-    try:
-        output_path = Path(pdf_path).parent / f"{Path(pdf_path).stem}_reconstructed.pdf"
-        reconstructor = PDFReconstructor(result)
-        reconstructor.build(str(output_path))
-        print(f"   ✓ PDF reconstructed successfully")
-        print(f"   - Output: {output_path}")
-    except Exception as e:
-        print(f"   ✗ Error reconstructing PDF: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    # The reconstructed file is a throwaway artifact, so it goes to a
+    # temporary directory rather than next to the input
+    with tempfile.TemporaryDirectory() as td:
+        # Reconstruct PDF from a local whitelist parse, since the sandbox
+        # removes its output file once the result is returned
+        print("\n[3] Reconstructing PDF...")
+        try:
+            output_path = Path(td) / f"{Path(pdf_path).stem}_reconstructed.pdf"
+            with Pdf.open(pdf_path) as original_pdf:
+                data = PDFWhitelistParser.from_pdf(original_pdf, pdf_path).parse()
+                if data['pages']:
+                    first_page = data['pages'][0]
+                    print(f"   - First page mediabox: {first_page.get('mediabox')}")
+                    print(f"   - First page has contents: {first_page.get('has_contents', False)}")
+                reconstructor = PDFReconstructor(data, original_pdf)
+                reconstructor.build(str(output_path), keep_open=False)
+            print(f"   ✓ PDF reconstructed successfully")
+            print(f"   - Output: {output_path}")
+        except Exception as e:
+            print(f"   ✗ Error reconstructing PDF: {e}")
+            traceback.print_exc()
+            return False
     
-    # Verify reconstructed PDF
-    print("\n[4] Verifying reconstructed PDF...")
-    try:
-        reconstructed_pdf = Pdf.open(str(output_path))
-        print(f"   ✓ Reconstructed PDF opened successfully")
-        print(f"   - Pages: {len(reconstructed_pdf.pages)}")
-        print(f"   - Has metadata: {reconstructed_pdf.docinfo is not None}")
+        # Verify reconstructed PDF
+        print("\n[4] Verifying reconstructed PDF...")
+        try:
+            reconstructed_pdf = Pdf.open(str(output_path))
+            print(f"   ✓ Reconstructed PDF opened successfully")
+            print(f"   - Pages: {len(reconstructed_pdf.pages)}")
+            print(f"   - Has metadata: {reconstructed_pdf.docinfo is not None}")
         
-        # Check page structure
-        for i, page in enumerate(reconstructed_pdf.pages[:3]):
-            has_contents = hasattr(page, 'Contents') and page.Contents is not None
-            has_resources = hasattr(page, 'Resources') and page.Resources is not None
-            print(f"   - Page {i}: Contents={has_contents}, Resources={has_resources}")
+            # Check page structure
+            for i, page in enumerate(reconstructed_pdf.pages[:3]):
+                has_contents = hasattr(page, 'Contents') and page.Contents is not None
+                has_resources = hasattr(page, 'Resources') and page.Resources is not None
+                print(f"   - Page {i}: Contents={has_contents}, Resources={has_resources}")
         
-        reconstructed_pdf.close()
+            reconstructed_pdf.close()
         
-        # Try opening with other tools
-        file_size = output_path.stat().st_size
-        print(f"   - File size: {file_size} bytes")
+            # Try opening with other tools
+            file_size = output_path.stat().st_size
+            print(f"   - File size: {file_size} bytes")
         
-        print("\n✓ TEST PASSED")
-        return True
+            print("\n✓ TEST PASSED")
+            return True
         
-    except Exception as e:
-        print(f"   ✗ Error verifying reconstructed PDF: {e}")
-        import traceback
-        traceback.print_exc()
-        print("\n✗ TEST FAILED")
-        return False
+        except Exception as e:
+            print(f"   ✗ Error verifying reconstructed PDF: {e}")
+            traceback.print_exc()
+            print("\n✗ TEST FAILED")
+            return False
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     print("\n" + "="*70)
     print("PDF RECONSTRUCTION DEBUGGING TEST")
     print("="*70)
     
-    # Test with sample PDF
-    test_pdf_reconstruction("test_sample.pdf")
+    # Parse every test PDF through one sandbox worker, skipping outputs
+    # left behind by earlier runs
+    test_pdfs = [
+        p for p in sorted(Path('tests').glob('*.pdf'))
+        if not p.stem.endswith(('_reconstructed', '_sanitized'))
+    ]
+    results = SandboxedPDFParser().parse_batch([str(p) for p in test_pdfs])
+    for pdf_path, result in zip(test_pdfs, results):
+        test_pdf_reconstruction(str(pdf_path), result)
     
     # Test with sanitized PDF if it exists
     if Path("test_sample_sanitized.pdf").exists():
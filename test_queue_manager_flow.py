@@ -1,6 +1,7 @@
 """
 Test the queue_manager reconstruction flow (both worker success and fallback)
 """
+import traceback
 from pathlib import Path
 from src.queue_manager import QueueManager
 
@@ -35,5 +36,4 @@ try:
     
 except Exception as e:
     print(f"\nERROR: {e}")
-    import traceback
     traceback.print_exc()
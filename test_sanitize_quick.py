@@ -1,31 +1,36 @@
 #!/usr/bin/env python
-import sys
 from pathlib import Path
+import tempfile
 
-sys.path.insert(0, '.')
-from src.core_engine import PDFWhitelistParser, PDFReconstructor
+import pikepdf
+import traceback
+
+from src.core_engine import PDFReconstructor
+from testutils import cached_parse
 
 # Test with first PDF
 test_pdf = 'tests/scorereport.pdf'
+orig_size = Path(test_pdf).stat().st_size
 print(f'Testing with: {test_pdf}')
-print(f'Original size: {Path(test_pdf).stat().st_size} bytes')
+print(f'Original size: {orig_size} bytes')
 
 try:
-    parser = PDFWhitelistParser(test_pdf)
-    whitelisted_data = parser.parse()
-    print(f'Parsed {len(whitelisted_data.get("pages", []))} pages')
-    
-    original_pdf = parser.get_original_pdf()
-    output_path = 'test_output_sanitized.pdf'
-    
-    reconstructor = PDFReconstructor(whitelisted_data, original_pdf)
-    reconstructor.build(output_path)
-    
-    new_size = Path(output_path).stat().st_size
+    # One handle serves both the parse (on a cache miss) and the
+    # reconstructor, which copies pages from the original
+    with pikepdf.Pdf.open(test_pdf) as original_pdf:
+        whitelisted_data = cached_parse(test_pdf, original_pdf)
+        print(f'Parsed {len(whitelisted_data.get("pages", []))} pages')
+        
+        with tempfile.TemporaryDirectory() as td:
+            output_path = Path(td) / 'test_output_sanitized.pdf'
+            
+            reconstructor = PDFReconstructor(whitelisted_data, original_pdf)
+            reconstructor.build(str(output_path), keep_open=False)
+            
+            new_size = output_path.stat().st_size
     print(f'Sanitized size: {new_size} bytes')
-    print(f'Size ratio: {new_size / Path(test_pdf).stat().st_size * 100:.1f}%')
+    print(f'Size ratio: {new_size / orig_size * 100:.1f}%')
     print('SUCCESS!')
 except Exception as e:
     print(f'ERROR: {e}')
-    import traceback
     traceback.print_exc()
@@ -6,7 +6,6 @@ Quick test to verify all core components can be imported and initialized.
 import sys
 import logging
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 def test_imports():
@@ -33,7 +32,7 @@ def test_imports():
         
         return True
     except Exception as e:
-        logger.error(f"✗ Import failed: {e}")
+        logger.error("✗ Import failed: %s", e)
         return False
 
 def test_config_manager():
@@ -42,14 +41,14 @@ def test_config_manager():
     try:
         from src.config_manager import ConfigManager
         config = ConfigManager()
-        logger.info(f"✓ ConfigManager initialized")
-        logger.info(f"  - Sanitization policy: {config.get('sanitization_policy')}")
-        logger.info(f"  - Memory limit: {config.get('memory_limit_mb')} MB")
-        logger.info(f"  - Timeout: {config.get('timeout_seconds')} seconds")
-        logger.info(f"  - Config valid: {config.validate_config()}")
+        logger.info("✓ ConfigManager initialized")
+        logger.info("  - Sanitization policy: %s", config.get('sanitization_policy'))
+        logger.info("  - Memory limit: %s MB", config.get('memory_limit_mb'))
+        logger.info("  - Timeout: %s seconds", config.get('timeout_seconds'))
+        logger.info("  - Config valid: %s", config.validate_config())
         return True
     except Exception as e:
-        logger.error(f"✗ ConfigManager test failed: {e}")
+        logger.error("✗ ConfigManager test failed: %s", e)
         return False
 
 def test_audit_logger():
@@ -58,40 +57,34 @@ def test_audit_logger():
     try:
         from src.audit_logger import AuditLogger
         audit = AuditLogger(log_directory="logs")
-        logger.info(f"✓ AuditLogger initialized")
-        logger.info(f"  - Log directory: {audit.log_dir}")
+        logger.info("✓ AuditLogger initialized")
+        logger.info("  - Log directory: %s", audit.log_dir)
         return True
     except Exception as e:
-        logger.error(f"✗ AuditLogger test failed: {e}")
+        logger.error("✗ AuditLogger test failed: %s", e)
         return False
 
-def test_sandboxing():
+def test_sandboxing(sandbox_parser):
     """Test SandboxedPDFParser initialization."""
     logger.info("\nTesting SandboxedPDFParser...")
     try:
-        from src.sandboxing import SandboxedPDFParser
-        parser = SandboxedPDFParser()
-        logger.info(f"✓ SandboxedPDFParser initialized")
-        logger.info(f"  - Memory limit: {parser.memory_limit_mb} MB")
-        logger.info(f"  - Timeout: {parser.cpu_time_limit_sec} seconds")
+        logger.info("✓ SandboxedPDFParser initialized")
+        logger.info("  - Memory limit: %s MB", sandbox_parser.memory_limit_mb)
+        logger.info("  - Timeout: %s seconds", sandbox_parser.cpu_time_limit_sec)
         return True
     except Exception as e:
-        logger.error(f"✗ SandboxedPDFParser test failed: {e}")
+        logger.error("✗ SandboxedPDFParser test failed: %s", e)
         return False
 
-def test_queue_manager():
+def test_queue_manager(queue_manager):
     """Test QueueManager initialization."""
     logger.info("\nTesting QueueManager...")
     try:
-        from src.sandboxing import SandboxedPDFParser
-        from src.queue_manager import QueueManager
-        parser = SandboxedPDFParser()
-        queue = QueueManager(parser)
-        logger.info(f"✓ QueueManager initialized")
-        logger.info(f"  - Queue length: {len(queue.queue)}")
+        logger.info("✓ QueueManager initialized")
+        logger.info("  - Queue length: %s", len(queue_manager.queue))
         return True
     except Exception as e:
-        logger.error(f"✗ QueueManager test failed: {e}")
+        logger.error("✗ QueueManager test failed: %s", e)
         return False
 
 def test_core_engine():
@@ -99,12 +92,12 @@ def test_core_engine():
     logger.info("\nTesting Core Engine...")
     try:
         from src.core_engine import WHITELISTED_PDF_OBJECTS, WHITELISTED_STREAM_OPERATORS
-        logger.info(f"✓ Core engine whitelist definitions loaded")
-        logger.info(f"  - Whitelisted PDF objects: {len(WHITELISTED_PDF_OBJECTS)}")
-        logger.info(f"  - Whitelisted stream operators: {len(WHITELISTED_STREAM_OPERATORS)}")
+        logger.info("✓ Core engine whitelist definitions loaded")
+        logger.info("  - Whitelisted PDF objects: %s", len(WHITELISTED_PDF_OBJECTS))
+        logger.info("  - Whitelisted stream operators: %s", len(WHITELISTED_STREAM_OPERATORS))
         return True
     except Exception as e:
-        logger.error(f"✗ Core engine test failed: {e}")
+        logger.error("✗ Core engine test failed: %s", e)
         return False
 
 def main():
@@ -117,8 +110,24 @@ def main():
     results.append(("Module Imports", test_imports()))
     results.append(("ConfigManager", test_config_manager()))
     results.append(("AuditLogger", test_audit_logger()))
-    results.append(("SandboxedPDFParser", test_sandboxing()))
-    results.append(("QueueManager", test_queue_manager()))
+    
+    # Build the parser and queue manager once and share them, as the
+    # session fixtures in conftest.py do under pytest
+    try:
+        from src.sandboxing import SandboxedPDFParser
+        parser = SandboxedPDFParser()
+    except Exception as e:
+        logger.error("✗ SandboxedPDFParser test failed: %s", e)
+        parser = None
+    results.append(("SandboxedPDFParser", parser is not None and test_sandboxing(parser)))
+    
+    try:
+        from src.queue_manager import QueueManager
+        queue = QueueManager(parser)
+    except Exception as e:
+        logger.error("✗ QueueManager test failed: %s", e)
+        queue = None
+    results.append(("QueueManager", queue is not None and test_queue_manager(queue)))
     results.append(("Core Engine", test_core_engine()))
     
     logger.info("\n" + "=" * 70)
@@ -130,13 +139,14 @@ def main():
     
     for name, result in results:
         status = "✓ PASS" if result else "✗ FAIL"
-        logger.info(f"{status}: {name}")
+        logger.info("%s: %s", status, name)
     
     logger.info("=" * 70)
-    logger.info(f"Total: {passed}/{total} tests passed")
+    logger.info("Total: %s/%s tests passed", passed, total)
     logger.info("=" * 70)
     
     return 0 if passed == total else 1
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Helpers shared by the top-level test scripts, usable both from plain
+script runs and from the pytest fixtures in conftest.py.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent
+
+# Sample PDF used by the pipeline tests, checked for once per session
+FIXTURE_PDF = PROJECT_ROOT / "test_sample.pdf"
+FIXTURE_PDF_EXISTS = FIXTURE_PDF.exists()
+
+# On-disk cache of PDFWhitelistParser.parse() results, see cached_parse()
+PARSE_CACHE_DIR = PROJECT_ROOT / "tests" / ".cache"
+
+
+def file_sha256(path) -> str:
+    """Streams a file through SHA-256 without reading it into memory."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        hasher = hashlib.sha256()
+        while chunk := f.read(1 << 20):
+            hasher.update(chunk)
+        return hasher.hexdigest()
+
+
+def cached_parse(path, pdf=None) -> dict:
+    """
+    Returns PDFWhitelistParser(path).parse(), cached on disk under
+    tests/.cache. The key includes the file's mtime and size, so editing
+    or replacing the PDF invalidates its entry. If the caller already has
+    the document open, pass it as pdf and a cache miss will parse it
+    instead of opening the file again.
+    """
+    st = os.stat(path)
+    key = (str(Path(path).resolve()), st.st_mtime_ns, st.st_size)
+    entry = PARSE_CACHE_DIR / f"{hashlib.sha1(repr(key).encode()).hexdigest()}.pickle"
+    try:
+        return pickle.loads(entry.read_bytes())
+    except FileNotFoundError:
+        pass
+
+    from src.core_engine import PDFWhitelistParser
+    if pdf is not None:
+        data = PDFWhitelistParser.from_pdf(pdf, str(path)).parse()
+    else:
+        parser = PDFWhitelistParser(str(path))
+        try:
+            data = parser.parse()
+        finally:
+            parser.get_original_pdf().close()
+
+    PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    partial = entry.with_suffix(f".{os.getpid()}.tmp")
+    partial.write_bytes(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    os.replace(partial, entry)
+    return data
+
+
+@functools.lru_cache()
+def build_pipeline() -> dict:
+    """
+    Builds the config, sandboxed parser and audit logger once per process.
+    Script-mode entry points call this directly; pytest uses the pipeline
+    fixture in conftest.py.
+    """
+    from src.config_manager import ConfigManager
+    from src.sandboxing import SandboxedPDFParser
+    from src.audit_logger import AuditLogger
+
+    config = ConfigManager()
+    return {
+        "config": config,
+        "parser": SandboxedPDFParser(),
+        "audit": AuditLogger(log_directory=config.get("log_directory")),
+    }
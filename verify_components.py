@@ -6,7 +6,6 @@ Quick component test without GUI or USB monitoring.
 import sys
 import logging
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 def main():
@@ -20,11 +19,12 @@ def main():
         from src.config_manager import ConfigManager
         config = ConfigManager()
         assert config.validate_config(), "Config validation failed"
-        logger.info(f"    ✓ Config: policy={config.get('sanitization_policy')}, "
-                   f"memory={config.get('memory_limit_mb')}MB, "
-                   f"timeout={config.get('timeout_seconds')}s")
+        logger.info("    ✓ Config: policy=%s, memory=%sMB, timeout=%ss",
+                    config.get('sanitization_policy'),
+                    config.get('memory_limit_mb'),
+                    config.get('timeout_seconds'))
     except Exception as e:
-        logger.error(f"    ✗ ConfigManager failed: {e}")
+        logger.error("    ✗ ConfigManager failed: %s", e)
         return 1
     
     # Test 2: AuditLogger
@@ -32,19 +32,19 @@ def main():
         logger.info("\n[2] Testing AuditLogger...")
         from src.audit_logger import AuditLogger
         audit = AuditLogger(log_directory="logs")
-        logger.info(f"    ✓ AuditLogger: log_dir={audit.log_dir}")
+        logger.info("    ✓ AuditLogger: log_dir=%s", audit.log_dir)
     except Exception as e:
-        logger.error(f"    ✗ AuditLogger failed: {e}")
+        logger.error("    ✗ AuditLogger failed: %s", e)
         return 1
     
     # Test 3: Core Engine
     try:
         logger.info("\n[3] Testing Core Engine...")
         from src.core_engine import WHITELISTED_PDF_OBJECTS, WHITELISTED_STREAM_OPERATORS
-        logger.info(f"    ✓ Whitelisted PDF Objects: {len(WHITELISTED_PDF_OBJECTS)} items")
-        logger.info(f"    ✓ Whitelisted Stream Operators: {len(WHITELISTED_STREAM_OPERATORS)} items")
+        logger.info("    ✓ Whitelisted PDF Objects: %s items", len(WHITELISTED_PDF_OBJECTS))
+        logger.info("    ✓ Whitelisted Stream Operators: %s items", len(WHITELISTED_STREAM_OPERATORS))
     except Exception as e:
-        logger.error(f"    ✗ Core Engine failed: {e}")
+        logger.error("    ✗ Core Engine failed: %s", e)
         return 1
     
     # Test 4: SandboxedPDFParser
@@ -52,30 +52,29 @@ def main():
         logger.info("\n[4] Testing SandboxedPDFParser...")
         from src.sandboxing import SandboxedPDFParser
         parser = SandboxedPDFParser()
-        logger.info(f"    ✓ SandboxedPDFParser: memory={parser.memory_limit_mb}MB, timeout={parser.cpu_time_limit_sec}s")
+        logger.info("    ✓ SandboxedPDFParser: memory=%sMB, timeout=%ss", parser.memory_limit_mb, parser.cpu_time_limit_sec)
     except Exception as e:
-        logger.error(f"    ✗ SandboxedPDFParser failed: {e}")
+        logger.error("    ✗ SandboxedPDFParser failed: %s", e)
         return 1
     
     # Test 5: QueueManager (without signals)
     try:
         logger.info("\n[5] Testing QueueManager...")
         from src.queue_manager import QueueManager
-        from src.sandboxing import SandboxedPDFParser
-        parser = SandboxedPDFParser()
+        # Reuse the parser built in [4]
         queue_mgr = QueueManager(parser)
-        logger.info(f"    ✓ QueueManager: queue size={len(queue_mgr.queue)}")
+        logger.info("    ✓ QueueManager: queue size=%s", len(queue_mgr.queue))
     except Exception as e:
-        logger.error(f"    ✗ QueueManager failed: {e}")
+        logger.error("    ✗ QueueManager failed: %s", e)
         return 1
     
     # Test 6: USB Utils
     try:
         logger.info("\n[6] Testing USB Utils...")
         from src.usb_utils import is_mount_readonly, read_pdf_from_usb
-        logger.info(f"    ✓ USB utils: Functions available")
+        logger.info("    ✓ USB utils: Functions available")
     except Exception as e:
-        logger.error(f"    ✗ USB Utils failed: {e}")
+        logger.error("    ✗ USB Utils failed: %s", e)
         return 1
     
     logger.info("\n" + "=" * 70)
@@ -88,4 +87,5 @@ def main():
     return 0
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     sys.exit(main())